@@ -1,8 +1,12 @@
 """Database connection management for SQL Anywhere."""
 
+import asyncio
+import functools
 import os
+import threading
 import time
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, List, Sequence
 import pyodbc
 from dotenv import load_dotenv
 from sqlanywhere_mcp.errors import ConnectionError as MCPConnectionError
@@ -10,18 +14,65 @@ from sqlanywhere_mcp.errors import ConnectionError as MCPConnectionError
 # Load environment variables
 load_dotenv()
 
+# Seconds a pool connection may sit unchecked before it is probed on checkout
+_LIVENESS_CHECK_INTERVAL = 30
+
+# Upper bound on rows the cursor fetches per block for ad-hoc queries
+_QUERY_ARRAYSIZE = 1000
+
+# Default maximum open connections; the database worker threads are sized to
+# the resolved pool size so every worker can hold its own connection
+_DEFAULT_POOL_SIZE = 4
+
+
+class _PooledConnection:
+    """An open pool connection with its reusable cursor."""
+
+    __slots__ = ("connection", "cursor", "generation", "last_checked")
+
+    def __init__(self, connection: pyodbc.Connection, generation: int):
+        """
+        Initialize pooled connection.
+
+        Args:
+            connection: Open pyodbc connection
+            generation: Pool generation the connection was opened in
+        """
+        self.connection = connection
+        self.cursor = connection.cursor()
+        self.generation = generation
+        self.last_checked = time.monotonic()
+
 
 class ConnectionManager:
     """Manages SQL Anywhere database connections via ODBC."""
 
     def __init__(self):
         """Initialize connection manager with environment variables."""
-        self._connection: Optional[pyodbc.Connection] = None
         self._connection_string = self._build_connection_string()
         self._query_timeout = int(os.getenv("SQLANYWHERE_QUERY_TIMEOUT", "30"))
         self._max_rows = int(os.getenv("SQLANYWHERE_MAX_ROWS", "1000"))
         self._max_rows_limit = int(os.getenv("SQLANYWHERE_MAX_ROWS_LIMIT", "10000"))
+        self._schema_cache_ttl = int(os.getenv("SQLANYWHERE_SCHEMA_CACHE_TTL", "300"))
+        self._pool_size = max(1, int(os.getenv("SQLANYWHERE_POOL_SIZE", str(_DEFAULT_POOL_SIZE))))
         self._authorized_users = self._parse_authorized_users()
+        # Lowercased once for case-insensitive owner checks on every query
+        self._authorized_owners = frozenset(u.lower() for u in self._authorized_users)
+        self._authorized_user_filter: Optional[tuple] = None
+        self._connection_info: Optional[dict] = None
+        # Pool generation the two values above were read in
+        self._info_generation = -1
+        # Connection pool. A pyodbc connection must not be used by two threads
+        # at once, so each one is checked out by a single caller at a time.
+        # Connections are opened on demand up to _pool_size; disconnect()
+        # bumps the generation so connections still checked out are closed
+        # when they come back.
+        self._lock = threading.RLock()
+        self._pool_available = threading.Condition(self._lock)
+        self._idle: List[_PooledConnection] = []
+        self._checked_out: dict[int, _PooledConnection] = {}
+        self._open_count = 0
+        self._generation = 0
 
     def _parse_authorized_users(self) -> List[str]:
         """
@@ -116,36 +167,284 @@ class ConnectionManager:
         """Get maximum allowed row limit."""
         return self._max_rows_limit
 
+    @property
+    def authorized_owners(self) -> frozenset:
+        """Get the lowercased authorized user names for owner validation."""
+        return self._authorized_owners
+
+    @property
+    def authorized_user_filter(self) -> tuple:
+        """
+        Get the catalog user_ids of the authorized users and their placeholders.
+
+        Resolved from SYS.SYSUSER by the first connection opened after
+        connecting or reconnecting, so schema queries can filter on the
+        creator column directly instead of joining SYSUSER. Users that do not exist in
+        the database are skipped. The placeholder string is built once
+        alongside the ids, so both always agree in length.
+
+        Returns:
+            Tuple of (user_ids, placeholders), where user_ids is a tuple of
+            integer user_ids and placeholders is "?,?,..." with one marker per
+            id, or "NULL" when no authorized user exists (IN (NULL) matches nothing)
+        """
+        if self._authorized_user_filter is None or self._open_count == 0:
+            self.connect()
+        return self._authorized_user_filter
+
+    def _resolve_authorized_user_filter(self, cursor: pyodbc.Cursor) -> tuple:
+        """
+        Look up the catalog user_ids of the authorized users.
+
+        Args:
+            cursor: Cursor on a connection not yet handed out by the pool
+
+        Returns:
+            Tuple of (user_ids, placeholders), see authorized_user_filter
+        """
+        user_ids = ()
+        if self._authorized_users:
+            cursor.execute(
+                "SELECT user_id FROM SYS.SYSUSER "
+                "WHERE user_name IN (SELECT row_value FROM sa_split_list(?))",
+                ",".join(self._authorized_users)
+            )
+            user_ids = tuple(row[0] for row in cursor.fetchall())
+        # An empty IN-list is invalid SQL; IN (NULL) matches nothing
+        placeholders = ",".join("?" * len(user_ids)) or "NULL"
+        return user_ids, placeholders
+
+    @property
+    def schema_cache_ttl(self) -> int:
+        """Get schema metadata cache time-to-live in seconds (0 disables caching)."""
+        return self._schema_cache_ttl
+
+    @property
+    def pool_size(self) -> int:
+        """Get the maximum number of pooled connections."""
+        return self._pool_size
+
     def connect(self) -> pyodbc.Connection:
         """
         Establish connection to SQL Anywhere database.
 
+        Opens the first pool connection if none is open yet. Run statements
+        through get_cursor() rather than on the returned connection, which
+        may be checked out by another thread.
+
         Returns:
             Active pyodbc connection
 
         Raises:
-            pyodbc.Error: If connection fails
-        """
-        if self._connection is None:
-            try:
-                self._connection = pyodbc.connect(
-                    self._connection_string,
-                    timeout=self._query_timeout,
-                    autocommit=True
-                )
-            except pyodbc.Error as e:
-                raise MCPConnectionError(
-                    message=f"Failed to connect to SQL Anywhere database: {e}",
-                    details=f"Connection string: {self._connection_string}"
-                ) from e
-
-        return self._connection
+            ConnectionError: If connection fails
+        """
+        pooled = self._acquire()
+        try:
+            return pooled.connection
+        finally:
+            self._release(pooled)
+
+    def _open_connection(self, generation: int) -> _PooledConnection:
+        """
+        Open a new pool connection.
+
+        The first connection of a generation also reads the driver info and
+        resolves the authorized user filter, before any caller can use it.
+
+        Args:
+            generation: Pool generation the connection belongs to
+
+        Returns:
+            New pooled connection
+
+        Raises:
+            ConnectionError: If connection fails
+        """
+        try:
+            conn = pyodbc.connect(
+                self._connection_string,
+                timeout=self._query_timeout,
+                autocommit=True
+            )
+        except pyodbc.Error as e:
+            raise MCPConnectionError(
+                message=f"Failed to connect to SQL Anywhere database: {e}",
+                details=f"Connection string: {self._connection_string}"
+            ) from e
+
+        try:
+            pooled = _PooledConnection(conn, generation)
+            if self._info_generation != generation:
+                # Driver info is fixed for the life of the connection
+                connection_info = {
+                    "server_name": conn.getinfo(pyodbc.SQL_SERVER_NAME),
+                    "database_name": conn.getinfo(pyodbc.SQL_DATABASE_NAME),
+                    "dbms_name": conn.getinfo(pyodbc.SQL_DBMS_NAME),
+                    "dbms_version": conn.getinfo(pyodbc.SQL_DBMS_VER),
+                }
+                user_filter = self._resolve_authorized_user_filter(pooled.cursor)
+                with self._lock:
+                    if generation > self._info_generation:
+                        self._connection_info = connection_info
+                        self._authorized_user_filter = user_filter
+                        self._info_generation = generation
+            return pooled
+        except BaseException:
+            conn.close()
+            raise
+
+    def _is_alive(self, pooled: _PooledConnection) -> bool:
+        """
+        Check that a pool connection still answers a simple query.
+
+        Args:
+            pooled: Connection checked out by the caller
+
+        Returns:
+            True if connection is valid
+        """
+        try:
+            pooled.cursor.execute("SELECT 1")
+            pooled.cursor.fetchone()
+            pooled.last_checked = time.monotonic()
+            return True
+        except pyodbc.Error:
+            return False
+
+    def _acquire(self) -> _PooledConnection:
+        """
+        Check out a pool connection, opening or waiting for one as needed.
+
+        An idle connection is probed at most once per _LIVENESS_CHECK_INTERVAL
+        seconds and replaced if the probe fails.
+
+        Returns:
+            Pooled connection owned by the caller until _release()
+
+        Raises:
+            ConnectionError: If a new connection cannot be opened
+        """
+        with self._lock:
+            while not self._idle and self._open_count >= self._pool_size:
+                self._pool_available.wait()
+            if self._idle:
+                # Most recently used first, so spare connections stay idle
+                pooled = self._idle.pop()
+            else:
+                pooled = None
+                self._open_count += 1
+            generation = self._generation
+
+        try:
+            if pooled is not None and (
+                    time.monotonic() - pooled.last_checked >= _LIVENESS_CHECK_INTERVAL
+                    and not self._is_alive(pooled)):
+                self._close(pooled)
+                pooled = None
+            if pooled is None:
+                pooled = self._open_connection(generation)
+        except BaseException:
+            with self._lock:
+                self._open_count -= 1
+                self._pool_available.notify()
+            raise
+        return pooled
+
+    def _release(self, pooled: _PooledConnection, discard: bool = False):
+        """
+        Return a checked-out connection to the pool.
+
+        Args:
+            pooled: Connection returned by _acquire()
+            discard: Close the connection instead of keeping it
+        """
+        with self._lock:
+            if discard or pooled.generation != self._generation:
+                self._open_count -= 1
+            else:
+                self._idle.append(pooled)
+                pooled = None
+            self._pool_available.notify()
+        if pooled is not None:
+            self._close(pooled)
+
+    def _close(self, pooled: _PooledConnection):
+        """
+        Close a pool connection, ignoring errors from a dead connection.
+
+        Args:
+            pooled: Connection no longer held by the pool
+        """
+        try:
+            pooled.connection.close()
+        except pyodbc.Error:
+            pass
+
+    @property
+    def connection_info(self) -> dict:
+        """
+        Get driver information about the current connection, connecting if necessary.
+
+        Read with getinfo() by the first connection opened after connecting
+        or reconnecting.
+
+        Returns:
+            Dict with server_name, database_name, dbms_name and dbms_version
+        """
+        if self._connection_info is None or self._open_count == 0:
+            self.connect()
+        return self._connection_info
+
+    def get_cursor(self) -> pyodbc.Cursor:
+        """
+        Check out a pool connection and get its reusable cursor.
+
+        The cursor is kept open with its connection across calls. Hand it back
+        with release_cursor() instead of closing it; until then no other
+        thread uses the connection.
+
+        Returns:
+            Open pyodbc cursor on a pooled connection
+        """
+        pooled = self._acquire()
+        with self._lock:
+            self._checked_out[id(pooled.cursor)] = pooled
+        return pooled.cursor
+
+    def release_cursor(self, cursor: pyodbc.Cursor, failed: bool = False):
+        """
+        Return a cursor obtained from get_cursor() for reuse.
+
+        Drains any pending result sets so the next statement starts clean and
+        returns the connection to the pool. A connection whose cursor cannot
+        be drained is closed and replaced on next use.
+
+        Args:
+            cursor: Cursor returned by get_cursor()
+            failed: The last statement failed, so probe the connection before
+                it is used again
+        """
+        with self._lock:
+            pooled = self._checked_out.pop(id(cursor))
+        if failed:
+            pooled.last_checked = 0.0
+        try:
+            while cursor.nextset():
+                pass
+        except pyodbc.Error:
+            self._release(pooled, discard=True)
+        else:
+            self._release(pooled)
 
     def disconnect(self):
-        """Close the database connection."""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        """Close the database connections."""
+        with self._lock:
+            self._generation += 1
+            idle, self._idle = self._idle, []
+            self._open_count -= len(idle)
+        # Connections still checked out are closed when they are released
+        for pooled in idle:
+            self._close(pooled)
 
     def reconnect(self) -> pyodbc.Connection:
         """
@@ -164,29 +463,17 @@ class ConnectionManager:
         Returns:
             True if connection is valid
         """
-        if self._connection is None:
-            return False
+        with self._lock:
+            if self._open_count == 0:
+                return False
 
         try:
-            # Try a simple query to validate connection
-            cursor = self._connection.cursor()
-            cursor.execute("SELECT 1")
-            cursor.fetchone()
-            cursor.close()
-            return True
-        except pyodbc.Error:
+            pooled = self._acquire()
+        except MCPConnectionError:
             return False
-
-    def get_connection(self) -> pyodbc.Connection:
-        """
-        Get active connection, reconnecting if necessary.
-
-        Returns:
-            Active pyodbc connection
-        """
-        if not self.is_connected():
-            return self.reconnect()
-        return self._connection
+        alive = self._is_alive(pooled)
+        self._release(pooled, discard=not alive)
+        return alive
 
     def execute_query(
         self,
@@ -205,10 +492,12 @@ class ConnectionManager:
         Returns:
             Tuple of (rows as dicts, column names, column types)
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        # Reuse the pooled connection's cursor: repeating the same query text
+        # lets the driver skip re-preparing the statement
+        cursor = self.get_cursor()
+        failed = False
 
         try:
             if params:
@@ -232,34 +521,47 @@ class ConnectionManager:
             # Convert to list of dicts
             result = [dict(zip(columns, row)) for row in rows]
 
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
 
             return result, columns, column_types
 
+        except pyodbc.Error:
+            # Probe the connection before it is used again
+            failed = True
+            raise
+
         finally:
-            cursor.close()
+            self.release_cursor(cursor, failed=failed)
 
     def execute_query_with_metadata(
         self,
         query: str,
         params: Optional[tuple] = None,
         max_rows: Optional[int] = None
-    ) -> tuple[list[dict], int, float, bool]:
+    ) -> tuple[list[str], list[Sequence[Any]], int, float, bool]:
         """
         Execute a query and return results with metadata.
 
+        Rows are returned as the driver's row tuples, in column order, so
+        callers that only need values do not pay for a dict per row.
+
         Args:
             query: SQL query to execute
             params: Optional query parameters
             max_rows: Maximum number of rows to return
 
         Returns:
-            Tuple of (rows, row_count, execution_time, has_more)
+            Tuple of (columns, rows, row_count, execution_time, has_more)
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        # Reuse the pooled connection's cursor: repeating the same query text
+        # lets the driver skip re-preparing the statement
+        cursor = self.get_cursor()
+        # Fetch the requested page (plus the has_more probe row) in as few
+        # blocks as possible
+        cursor.arraysize = min(max_rows + 1, _QUERY_ARRAYSIZE) if max_rows else _QUERY_ARRAYSIZE
+        failed = False
 
         try:
             if params:
@@ -272,21 +574,26 @@ class ConnectionManager:
                 rows = cursor.fetchmany(max_rows + 1)
                 has_more = len(rows) > max_rows
                 if has_more:
-                    rows = rows[:max_rows]
+                    # Drop the probe row in place instead of copying the page
+                    del rows[max_rows:]
             else:
                 rows = cursor.fetchall()
                 has_more = False
 
             # Get column information
             columns = [column[0] for column in cursor.description]
-            result = [dict(zip(columns, row)) for row in rows]
 
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
+
+            return columns, rows, len(rows), execution_time, has_more
 
-            return result, len(result), execution_time, has_more
+        except pyodbc.Error:
+            # Probe the connection before it is used again
+            failed = True
+            raise
 
         finally:
-            cursor.close()
+            self.release_cursor(cursor, failed=failed)
 
     def _get_sql_type_name(self, type_code: int) -> str:
         """
@@ -343,3 +650,30 @@ def get_connection_manager() -> ConnectionManager:
     if _connection_manager is None:
         _connection_manager = ConnectionManager()
     return _connection_manager
+
+
+# Blocking driver calls run on these threads instead of the default executor;
+# created on first use with one worker per pooled connection
+_db_executor: Optional[ThreadPoolExecutor] = None
+
+
+async def run_in_db_thread(func: Callable, *args, **kwargs) -> Any:
+    """
+    Run a blocking database call on a database worker thread.
+
+    Args:
+        func: Blocking function to call
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Result of func
+    """
+    global _db_executor
+    if _db_executor is None:
+        _db_executor = ThreadPoolExecutor(
+            max_workers=get_connection_manager().pool_size,
+            thread_name_prefix="sqlanywhere-db"
+        )
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_db_executor, functools.partial(func, *args, **kwargs))
@@ -3,7 +3,10 @@
 Provides consistent formatting functions for all tool outputs.
 """
 
-from typing import List, Dict, Any, Optional
+from collections import defaultdict
+from typing import List, Any, Optional, Sequence
+import orjson
+from pydantic import BaseModel
 from sqlanywhere_mcp.models import (
     TableInfo,
     ViewInfo,
@@ -61,6 +64,25 @@ def format_markdown_section(title: str, content: str, level: int = 2) -> str:
     return f"{'#' * level} {title}\n\n{content}"
 
 
+# ============================================================================
+# JSON Utilities
+# ============================================================================
+
+def to_json(model: BaseModel, indent: bool = True) -> str:
+    """
+    Serialize a response model as JSON.
+
+    Args:
+        model: Pydantic model to serialize
+        indent: Indent with 2 spaces (False emits compact single-line JSON)
+
+    Returns:
+        JSON string
+    """
+    option = orjson.OPT_INDENT_2 if indent else None
+    return orjson.dumps(model.model_dump(mode="json"), option=option).decode()
+
+
 # ============================================================================
 # Table Formatting
 # ============================================================================
@@ -103,9 +125,11 @@ def format_table_list_markdown_with_pagination(
     output.append("| Table Name | Owner | Type | Row Count |")
     output.append("|------------|-------|------|-----------|")
 
-    for table_name, table_owner, table_type, row_count in tables:
-        row_count_str = f"{row_count:,}" if row_count is not None else "N/A"
-        output.append(f"| {table_name} | {table_owner} | {table_type} | {row_count_str} |")
+    output.extend(
+        f"| {table_name} | {table_owner} | {table_type} | "
+        f"{f'{row_count:,}' if row_count is not None else 'N/A'} |"
+        for table_name, table_owner, table_type, row_count in tables
+    )
 
     return "\n".join(output)
 
@@ -150,7 +174,7 @@ def format_table_details_markdown(
         output.append("|--------|------|--------|-------|----------|---------|")
 
         for col in columns:
-            col_name, domain_id, width, scale, nulls, default_val = col
+            col_name, domain_id, width, scale, nulls, default_val, _is_pk = col
             nullable = "YES" if nulls == "Y" else "NO"
             default = default_val if default_val else ""
             output.append(f"| {col_name} | {domain_id} | {width or ''} | {scale or ''} | {nullable} | {default} |")
@@ -161,10 +185,8 @@ def format_table_details_markdown(
     if primary_keys:
         output.append("### Primary Keys")
         output.append("")
-        pk_dict = {}
+        pk_dict = defaultdict(list)
         for pk_name, col_name in primary_keys:
-            if pk_name not in pk_dict:
-                pk_dict[pk_name] = []
             pk_dict[pk_name].append(col_name)
 
         for pk_name, cols in pk_dict.items():
@@ -183,15 +205,15 @@ def format_table_details_markdown(
     if indexes:
         output.append("### Indexes")
         output.append("")
-        idx_dict = {}
+        idx_unique = {}
+        idx_columns = defaultdict(list)
         for idx_name, unique, col_name, order_val in indexes:
-            if idx_name not in idx_dict:
-                idx_dict[idx_name] = {"unique": unique, "columns": []}
-            idx_dict[idx_name]["columns"].append(f"{col_name} {'ASC' if order_val == 'A' else 'DESC'}")
+            idx_unique.setdefault(idx_name, unique)
+            idx_columns[idx_name].append(f"{col_name} {'ASC' if order_val == 'A' else 'DESC'}")
 
-        for idx_name, idx_info in idx_dict.items():
-            unique_str = "Unique " if idx_info["unique"] == "Y" else ""
-            cols = ", ".join(idx_info["columns"])
+        for idx_name, columns in idx_columns.items():
+            unique_str = "Unique " if idx_unique[idx_name] == "Y" else ""
+            cols = ", ".join(columns)
             output.append(f"- **{idx_name}**: ({unique_str}{cols})")
         output.append("")
 
@@ -219,8 +241,7 @@ def format_view_list_markdown(views: List[tuple], total_count: int) -> str:
     output.append("| View Name | Owner |")
     output.append("|-----------|-------|")
 
-    for view_name, view_owner in views:
-        output.append(f"| {view_name} | {view_owner} |")
+    output.extend(f"| {view_name} | {view_owner} |" for view_name, view_owner in views)
 
     return "\n".join(output)
 
@@ -275,8 +296,7 @@ def format_procedure_list_markdown(procedures: List[tuple], total_count: int) ->
     output.append("| Name | Owner |")
     output.append("|------|-------|")
 
-    for proc_name, proc_owner in procedures:
-        output.append(f"| {proc_name} | {proc_owner} |")
+    output.extend(f"| {proc_name} | {proc_owner} |" for proc_name, proc_owner in procedures)
 
     return "\n".join(output)
 
@@ -470,8 +490,29 @@ def format_database_info_markdown(
 # Query Results Formatting
 # ============================================================================
 
+def _format_query_cell(val: Any) -> str:
+    """
+    Format a single query result value as a Markdown table cell.
+
+    Args:
+        val: Column value from the result row
+
+    Returns:
+        Cell text, truncated to 100 characters
+    """
+    if val is None:
+        return "NULL"
+
+    # Truncate long strings
+    val_str = str(val)
+    if len(val_str) > 100:
+        val_str = val_str[:97] + "..."
+    return val_str
+
+
 def format_query_results_markdown(
-    rows: List[Dict[str, Any]],
+    columns: List[str],
+    rows: Sequence[Sequence[Any]],
     row_count: int,
     execution_time: float,
     has_more: bool,
@@ -481,7 +522,8 @@ def format_query_results_markdown(
     Format query results as Markdown.
 
     Args:
-        rows: Query result rows
+        columns: Column names
+        rows: Query result rows as value tuples, in column order
         row_count: Number of rows returned
         execution_time: Query execution time in seconds
         has_more: Whether more rows exist
@@ -504,26 +546,14 @@ def format_query_results_markdown(
 
     output.append("")
 
-    # Get column names from first row
-    columns = list(rows[0].keys())
-
     # Create table header
     output.append("| " + " | ".join(columns) + " |")
     output.append("| " + " | ".join(["---"] * len(columns)) + " |")
 
     # Add rows
-    for row in rows:
-        values = []
-        for col in columns:
-            val = row[col]
-            if val is None:
-                values.append("NULL")
-            else:
-                # Truncate long strings
-                val_str = str(val)
-                if len(val_str) > 100:
-                    val_str = val_str[:97] + "..."
-                values.append(val_str)
-        output.append("| " + " | ".join(values) + " |")
+    output.extend(
+        "| " + " | ".join(map(_format_query_cell, row)) + " |"
+        for row in rows
+    )
 
     return "\n".join(output)
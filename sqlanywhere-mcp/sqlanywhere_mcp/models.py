@@ -9,6 +9,7 @@ Models are organized by tool/functionality:
 - Query tools (execute_query, validate_query)
 """
 
+import re
 from typing import Optional, List
 from enum import Enum
 from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
@@ -408,10 +409,50 @@ class IndexListResponse(BaseModel):
     next_offset: Optional[int] = Field(default=None, description="Next offset to use for pagination")
 
 
+# ============================================================================
+# Schema Overview Models
+# ============================================================================
+
+# Input Models
+class ListAllSchemaInput(BaseModel):
+    """Input model for list_all_schema operations."""
+    model_config = ConfigDict(
+        str_strip_whitespace=True,
+        validate_assignment=True,
+        extra='forbid'
+    )
+
+    limit: int = Field(default=100, description="Maximum number of objects to return per object type", ge=1, le=10000)
+    response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN, description="Output format")
+
+
+# Output/Response Models
+class SchemaListResponse(BaseModel):
+    """Response from list_all_schema tool."""
+    model_config = ConfigDict(
+        validate_assignment=True
+    )
+    tables: TableListResponse = Field(description="Table listing")
+    views: ViewListResponse = Field(description="View listing")
+    procedures: ProcedureListResponse = Field(description="Procedure listing")
+
+
 # ============================================================================
 # Query Tools Models
 # ============================================================================
 
+class QueryResponseFormat(str, Enum):
+    """Response format options for query results."""
+    MARKDOWN = "markdown"
+    JSON = "json"
+    JSON_COMPACT = "json_compact"
+
+
+# Leading whitespace then SELECT, in any case; matched in place without
+# building stripped or upper-cased copies of the query. Shared with the
+# checks in queries.py so both validate the same prefix.
+SELECT_PREFIX_PATTERN = re.compile(r"\s*SELECT", re.IGNORECASE)
+
 # Input Models
 class ExecuteQueryInput(BaseModel):
     """Input model for execute_query operations."""
@@ -423,13 +464,16 @@ class ExecuteQueryInput(BaseModel):
 
     query: str = Field(..., description="SQL SELECT query to execute", min_length=1, max_length=10000)
     limit: Optional[int] = Field(default=None, description="Maximum rows to return (default: 1000, max: 10000)", ge=1, le=10000)
-    response_format: ResponseFormat = Field(default=ResponseFormat.MARKDOWN, description="Output format")
+    response_format: QueryResponseFormat = Field(
+        default=QueryResponseFormat.MARKDOWN,
+        description="Output format ('json_compact' sends rows as value arrays in column order)"
+    )
 
     @field_validator('query')
     @classmethod
     def validate_is_select(cls, v: str) -> str:
         """Validate that query starts with SELECT."""
-        if not v.strip().upper().startswith("SELECT"):
+        if not SELECT_PREFIX_PATTERN.match(v):
             raise ValueError("Only SELECT queries are allowed")
         return v
 
@@ -448,7 +492,7 @@ class ValidateQueryInput(BaseModel):
     @classmethod
     def validate_is_select(cls, v: str) -> str:
         """Validate that query starts with SELECT."""
-        if not v.strip().upper().startswith("SELECT"):
+        if not SELECT_PREFIX_PATTERN.match(v):
             raise ValueError("Only SELECT queries are allowed")
         return v
 
@@ -467,6 +511,19 @@ class QueryResult(BaseModel):
     has_more: bool = Field(default=False, description="Whether more rows exist beyond limit")
 
 
+class CompactQueryResult(BaseModel):
+    """Result of a data query with rows as value arrays instead of objects."""
+    model_config = ConfigDict(
+        validate_assignment=True
+    )
+    columns: List[str] = Field(description="Column names, in row value order")
+    column_types: dict = Field(description="Column name to type mapping")
+    rows: List[list] = Field(description="Query result rows as value arrays")
+    row_count: int = Field(description="Number of rows returned")
+    execution_time_seconds: float = Field(description="Query execution time in seconds")
+    has_more: bool = Field(default=False, description="Whether more rows exist beyond limit")
+
+
 # ============================================================================
 # Database Info Models
 # ============================================================================
@@ -2,59 +2,215 @@
 
 import re
 import json
-from typing import Optional, List
-from sqlanywhere_mcp.db import get_connection_manager
+import pyodbc
+from typing import Optional
+from sqlanywhere_mcp.db import ConnectionManager, get_connection_manager, run_in_db_thread
 from sqlanywhere_mcp.errors import QueryValidationError, InvalidParameterError, DatabaseError
-from sqlanywhere_mcp.models import ResponseFormat, QueryResult
-from sqlanywhere_mcp import formatters
+from sqlanywhere_mcp.models import (
+    SELECT_PREFIX_PATTERN,
+    QueryResponseFormat,
+    QueryResult,
+    CompactQueryResult,
+)
+from sqlanywhere_mcp import formatters, schema
+
+
+# Owner.table references in FROM and JOIN clauses, compiled once.
+# Matches: owner.table, "owner"."table", [owner].[table] and bare table names
+# (group 1 is the keyword; group 2 is empty when the reference has no owner).
+_FROM_JOIN_PATTERN = re.compile(
+    r'\b(FROM|JOIN)\s+'
+    r'(?:["\[]?([a-zA-Z_][a-zA-Z0-9_]*)["\]]?\s*\.\s*)?'
+    r'["\[]?([a-zA-Z_][a-zA-Z0-9_]*)',
+    re.IGNORECASE
+)
+
+# Name directly before an opening parenthesis, e.g. EXTRACT in "EXTRACT("
+_CALL_NAME_PATTERN = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)\s*$')
+
+# Functions whose argument syntax uses FROM, e.g. EXTRACT(YEAR FROM d). A
+# FROM directly inside any other parenthesis is checked as a table reference.
+_FROM_ARGUMENT_FUNCTIONS = frozenset({"extract", "overlay", "position", "substring", "trim"})
+
+# Comments, which could hide what follows a parenthesis from the scan, plus
+# the literals and quoted identifiers that may contain comment markers. Single
+# quoted strings are blanked; quoted identifiers are kept for owner matching.
+_COMMENT_OR_QUOTED_PATTERN = re.compile(
+    r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|\[[^\]]*\]|/\*.*?(?:\*/|$)|(?:--|//)[^\n]*",
+    re.DOTALL
+)
+
+# Statements that change data, schema or permissions, matched as whole words
+# so column names such as UPDATED_AT are not flagged
+_DANGEROUS_KEYWORD_PATTERN = re.compile(
+    r"\b(DROP|DELETE|INSERT|UPDATE|CREATE|ALTER|TRUNCATE|GRANT|REVOKE|EXEC|EXECUTE)\b",
+    re.IGNORECASE
+)
+
+# FROM as a whole word, for the basic syntax check in validate_query
+_FROM_KEYWORD_PATTERN = re.compile(r"\bFROM\b", re.IGNORECASE)
+
+# SQLSTATEs for a missing table or column. A query failing with one of these
+# means the cached details of the tables it references may be stale.
+_SCHEMA_DRIFT_SQLSTATES = frozenset({"42S02", "42S22"})
+
+# Leading WITH, for subqueries that open with a common table expression
+_WITH_PREFIX_PATTERN = re.compile(r"\s*WITH\b", re.IGNORECASE)
+
+# Leading SELECT [ALL | DISTINCT], after which a TOP clause can be inserted
+_SELECT_HEAD_PATTERN = re.compile(r"\s*SELECT\b(?:\s+(?:ALL|DISTINCT)\b)?", re.IGNORECASE)
+
+# Start of a select list that can follow "TOP n" unambiguously: a name,
+# quoted name, string or number literal, parenthesis, variable or a
+# free-standing * wildcard. Anything else, such as a leading - or + sign or a
+# * run into the next token, could be read as part of the TOP expression.
+_SELECT_LIST_START_PATTERN = re.compile(r"\s*(?:[A-Za-z0-9_\"\[('@]|\*(?=[\s,]|$))")
+
+# Constructs whose rows a leading TOP would limit differently than the final
+# result (existing row limits, set operators, FOR XML/JSON aggregation)
+_ROW_LIMIT_UNSAFE_PATTERN = re.compile(
+    r"\b(?:TOP|FIRST|LIMIT|UNION|EXCEPT|INTERSECT|MINUS|FOR\s+(?:XML|JSON))\b",
+    re.IGNORECASE
+)
+
+
+def _push_down_row_limit(query: str, max_rows: int) -> str:
+    """
+    Add a TOP clause so the server stops after the rows that will be fetched.
+
+    One row beyond max_rows is kept so has_more can still be detected. Queries
+    that already limit rows, or whose row count a leading TOP would change,
+    are returned unchanged.
 
+    Args:
+        query: Validated SQL SELECT query
+        max_rows: Maximum number of rows to return
 
-def _validate_query_authorization(query: str, authorized_users: List[str]) -> None:
+    Returns:
+        Query with "TOP max_rows+1" after the leading SELECT, or the original query
     """
-    Validate that query only accesses tables/views from authorized users.
+    if _ROW_LIMIT_UNSAFE_PATTERN.search(query):
+        return query
+
+    head = _SELECT_HEAD_PATTERN.match(query)
+    if head is None:
+        return query
+
+    rest = query[head.end():]
+    if not _SELECT_LIST_START_PATTERN.match(rest):
+        return query
+
+    return f"{query[:head.end()]} TOP {max_rows + 1} {rest.lstrip()}"
 
-    This function parses the FROM clause and JOIN clauses to extract
-    owner.table references and validates them against the authorized users list.
+
+def _in_function_arguments(query: str, pos: int) -> bool:
+    """
+    Check whether a position lies directly inside a function call's arguments.
+
+    FROM also appears inside calls such as EXTRACT(YEAR FROM d) and
+    SUBSTRING(s FROM 2), where it does not introduce a table. Only the
+    functions in _FROM_ARGUMENT_FUNCTIONS count, and subqueries, which open
+    with SELECT or WITH, are never treated as function arguments.
 
     Args:
-        query: SQL SELECT query to validate
-        authorized_users: List of authorized owner names
+        query: SQL query with comments removed
+        pos: Offset of a FROM keyword in query
 
-    Raises:
-        QueryValidationError: If query references unauthorized owners
+    Returns:
+        True if the innermost enclosing parenthesis belongs to a function call
     """
-    # Pattern to match owner.table references in FROM and JOIN clauses
-    # Matches: owner.table, "owner"."table", [owner].[table], etc.
-    # This looks for FROM/JOIN followed by optional whitespace and owner.table pattern
-    from_join_pattern = r'\b(?:FROM|JOIN)\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\.\s*([a-zA-Z_][a-zA-Z0-9_]*)'
+    depth = 0
+    for i in range(pos - 1, -1, -1):
+        char = query[i]
+        if char == ")":
+            depth += 1
+        elif char == "(":
+            if depth:
+                depth -= 1
+                continue
+            if SELECT_PREFIX_PATTERN.match(query, i + 1) or _WITH_PREFIX_PATTERN.match(query, i + 1):
+                return False
+            name = _CALL_NAME_PATTERN.search(query, 0, i)
+            return name is not None and name.group(1).lower() in _FROM_ARGUMENT_FUNCTIONS
+    return False
+
+
+def _strip_comment(match: re.Match) -> str:
+    """
+    Replace a comment or string literal matched by _COMMENT_OR_QUOTED_PATTERN.
+
+    Args:
+        match: Comment, string literal or quoted identifier
+
+    Returns:
+        A space for comments, an empty literal for strings, or the unchanged
+        quoted identifier
+    """
+    token = match.group(0)
+    if token[0] == "'":
+        return "''"
+    if token[0] in '"[':
+        return token
+    return " "
+
 
-    # Also handle quoted identifiers: "owner"."table" or [owner].[table]
-    quoted_pattern = r'\b(?:FROM|JOIN)\s+["\[]?([a-zA-Z_][a-zA-Z0-9_]*)["\]?\s*\.?\s*["\[]?([a-zA-Z_][a-zA-Z0-9_]*)["\]]?'
+def _table_references(query: str) -> list[tuple[str, str]]:
+    """
+    Extract the (owner, table) references from FROM and JOIN clauses.
+
+    Args:
+        query: SQL query
+
+    Returns:
+        List of (owner, table) pairs; owner is empty for unqualified names
+    """
+    query = _COMMENT_OR_QUOTED_PATTERN.sub(_strip_comment, query)
+    return [
+        (match.group(2) or "", match.group(3))
+        for match in _FROM_JOIN_PATTERN.finditer(query)
+        if match.group(1).upper() == "JOIN" or not _in_function_arguments(query, match.start())
+    ]
 
-    # Find all owner.table references
-    from_join_matches = re.findall(from_join_pattern, query, re.IGNORECASE)
-    quoted_matches = re.findall(quoted_pattern, query, re.IGNORECASE)
 
-    # Combine results and extract owners
+def _validate_query_authorization(query: str, cm: ConnectionManager) -> None:
+    """
+    Validate that query only accesses tables/views from authorized users.
+
+    This function scans the FROM clause and JOIN clauses in a single pass to
+    extract owner.table references and validates them against the authorized
+    users list.
+
+    Args:
+        query: SQL SELECT query to validate
+        cm: Connection manager holding the authorized users
+
+    Raises:
+        QueryValidationError: If query references unauthorized owners or
+            tables without an owner
+    """
     owners = set()
-    for match in from_join_matches:
-        if isinstance(match, tuple) and len(match) >= 1:
-            owners.add(match[0].lower())
+    unqualified = []
+    for owner, table in _table_references(query):
+        if owner:
+            owners.add(owner.lower())
+        else:
+            unqualified.append(table)
 
-    for match in quoted_matches:
-        if isinstance(match, tuple) and len(match) >= 1:
-            owners.add(match[0].lower())
+    if unqualified:
+        raise QueryValidationError(
+            query,
+            f"Table references {', '.join(unqualified)} have no owner. "
+            f"All FROM and JOIN clauses must use owner.table format (e.g., 'monitor.Part')."
+        )
 
     # Check if all owners are authorized
-    authorized_lower = [u.lower() for u in authorized_users]
-
-    unauthorized = owners - set(authorized_lower)
+    unauthorized = owners - cm.authorized_owners
 
     if unauthorized:
         raise QueryValidationError(
             query,
             f"Access to owners {', '.join(sorted(unauthorized))} is not authorized. "
-            f"Queries can only access tables/views owned by: {', '.join(sorted(authorized_users))}. "
+            f"Queries can only access tables/views owned by: {', '.join(sorted(cm._authorized_users))}. "
             f"Please ensure all FROM and JOIN clauses reference authorized owners."
         )
 
@@ -62,7 +218,7 @@ def _validate_query_authorization(query: str, authorized_users: List[str]) -> No
 async def execute_query(
     query: str,
     limit: Optional[int] = None,
-    response_format: ResponseFormat = ResponseFormat.MARKDOWN
+    response_format: QueryResponseFormat = QueryResponseFormat.MARKDOWN
 ) -> str:
     """
     Execute a SELECT query on the database.
@@ -70,7 +226,7 @@ async def execute_query(
     Args:
         query: SQL SELECT query to execute
         limit: Maximum number of rows to return (default: use config default)
-        response_format: Output format (markdown or json)
+        response_format: Output format (markdown, json or json_compact)
 
     Returns:
         Formatted query results in requested format
@@ -80,41 +236,26 @@ async def execute_query(
         QueryValidationError: If query references unauthorized owners
     """
     # Validate query is SELECT only
-    cleaned_query = query.strip().upper()
-    if not cleaned_query.startswith("SELECT"):
+    if not SELECT_PREFIX_PATTERN.match(query):
         raise QueryValidationError(
             query,
             "Only SELECT queries are allowed for security reasons. "
             "The query must start with 'SELECT'."
         )
 
-    # Check for dangerous keywords
-    dangerous_patterns = [
-        r"\bDROP\b",
-        r"\bDELETE\b",
-        r"\bINSERT\b",
-        r"\bUPDATE\b",
-        r"\bCREATE\b",
-        r"\bALTER\b",
-        r"\bTRUNCATE\b",
-        r"\bGRANT\b",
-        r"\bREVOKE\b",
-        r"\bEXEC\b",
-        r"\bEXECUTE\b",
-    ]
-
-    for pattern in dangerous_patterns:
-        if re.search(pattern, cleaned_query, re.IGNORECASE):
-            raise QueryValidationError(
-                query,
-                f"Dangerous keyword detected: {pattern}. "
-                "Only SELECT queries are allowed."
-            )
+    # Check for dangerous keywords in a single scan
+    match = _DANGEROUS_KEYWORD_PATTERN.search(query)
+    if match:
+        raise QueryValidationError(
+            query,
+            f"Dangerous keyword detected: {match.group(1).upper()}. "
+            "Only SELECT queries are allowed."
+        )
 
     cm = get_connection_manager()
 
     # Validate query against authorized users
-    _validate_query_authorization(query, cm._authorized_users)
+    _validate_query_authorization(query, cm)
 
     # Use configured default limit if not specified
     if limit is None:
@@ -128,31 +269,49 @@ async def execute_query(
             )
 
     try:
-        rows, row_count, execution_time, has_more = cm.execute_query_with_metadata(
-            query, max_rows=limit
+        columns, rows, row_count, execution_time, has_more = await run_in_db_thread(
+            cm.execute_query_with_metadata, _push_down_row_limit(query, limit), max_rows=limit
         )
 
-        # Get column information
-        columns = list(rows[0].keys()) if rows else []
-        column_types = {col: type(rows[0][col]).__name__ for col in columns} if rows else {}
+        # Get column information (empty results report no columns)
+        if not rows:
+            columns = []
+        column_types = {col: type(value).__name__ for col, value in zip(columns, rows[0])} if rows else {}
 
         # Format output based on response_format
-        if response_format == ResponseFormat.JSON:
-            # Create QueryResult model and return JSON
-            result = QueryResult(
-                rows=rows,
+        if response_format == QueryResponseFormat.JSON_COMPACT:
+            # Column names are sent once; each row is just its values
+            result = CompactQueryResult.model_construct(
+                columns=columns,
+                column_types=column_types,
+                rows=[list(row) for row in rows],
+                row_count=row_count,
+                execution_time_seconds=execution_time,
+                has_more=has_more
+            )
+            return formatters.to_json(result, indent=False)
+        elif response_format == QueryResponseFormat.JSON:
+            # Create QueryResult model and return JSON (rows come straight from
+            # the driver, so skip re-validating them)
+            result = QueryResult.model_construct(
+                rows=[dict(zip(columns, row)) for row in rows],
                 row_count=row_count,
                 columns=columns,
                 column_types=column_types,
                 execution_time_seconds=execution_time,
                 has_more=has_more
             )
-            return result.model_dump_json(indent=2)
+            return formatters.to_json(result)
         else:
             # Use formatter for markdown
-            return formatters.format_query_results_markdown(rows, row_count, execution_time, has_more, limit)
+            return formatters.format_query_results_markdown(columns, rows, row_count, execution_time, has_more, limit)
 
     except Exception as e:
+        if isinstance(e, pyodbc.Error) and e.args and e.args[0] in _SCHEMA_DRIFT_SQLSTATES:
+            # Only the objects this query touched may have drifted
+            schema.invalidate_object_metadata(
+                table for _owner, table in _table_references(query)
+            )
         raise DatabaseError("query execution", e)
 
 
@@ -171,18 +330,16 @@ async def validate_query(query: str) -> str:
     cleaned_query = query.strip()
 
     # Check if it starts with SELECT
-    if not cleaned_query.upper().startswith("SELECT"):
+    if not SELECT_PREFIX_PATTERN.match(cleaned_query):
         return "❌ **Invalid**: Query must start with SELECT"
 
-    # Check for dangerous keywords
-    dangerous_keywords = ["DROP", "DELETE", "INSERT", "UPDATE", "CREATE", "ALTER", "TRUNCATE"]
-
-    for keyword in dangerous_keywords:
-        if re.search(rf"\b{keyword}\b", cleaned_query, re.IGNORECASE):
-            return f"❌ **Invalid**: Dangerous keyword '{keyword}' detected"
+    # Check for dangerous keywords (the same set execute_query rejects)
+    match = _DANGEROUS_KEYWORD_PATTERN.search(cleaned_query)
+    if match:
+        return f"❌ **Invalid**: Dangerous keyword '{match.group(1).upper()}' detected"
 
     # Basic syntax check (very basic)
-    if not re.search(r"\bFROM\b", cleaned_query, re.IGNORECASE):
+    if not _FROM_KEYWORD_PATTERN.search(cleaned_query):
         return "❌ **Invalid**: SELECT query must include FROM clause"
 
     return "✅ **Valid**: Query appears to be a safe SELECT query (basic validation passed)"
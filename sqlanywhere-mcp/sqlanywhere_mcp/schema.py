@@ -2,7 +2,8 @@
 
 import pyodbc
 import json
-from typing import Optional, List
+from collections import defaultdict
+from typing import Callable, Iterable, Optional, List, Sequence
 from mcp import Tool
 from sqlanywhere_mcp.models import (
     TableInfo,
@@ -21,59 +22,119 @@ from sqlanywhere_mcp.models import (
     ViewListResponse,
     ProcedureListResponse,
     IndexListResponse,
+    SchemaListResponse,
 )
-from sqlanywhere_mcp.db import get_connection_manager
-from sqlanywhere_mcp.errors import DatabaseNotFoundError
+from sqlanywhere_mcp.db import ConnectionManager, get_connection_manager, run_in_db_thread
+from sqlanywhere_mcp.cache import TTLCache
+from sqlanywhere_mcp.errors import DatabaseError, DatabaseNotFoundError, InvalidParameterError
 from sqlanywhere_mcp import formatters
 
 
+# Rows fetched per ODBC block. List tools size this to their limit (never
+# below the minimum); detail tools use a default covering columns + indexes.
+_MIN_ARRAYSIZE = 128
+_DETAILS_ARRAYSIZE = 256
+
+# SYS.SYSIDXCOL "order" codes to display names
+_ORDER_MAP = {"A": "ASC", "D": "DESC"}
+
+
 # ============================================================================
 # Security Filter Helper Functions
 # ============================================================================
 
-def _build_authorized_users_filter(users: List[str]) -> str:
-    """
-    Build parameter placeholder string for authorized users filter.
-
-    Args:
-        users: List of authorized user names
-
-    Returns:
-        Comma-separated question marks for SQL parameter placeholders
-    """
-    return ",".join(["?" for _ in users])
+# Final SQL text keyed by (query template, authorized user placeholders), or
+# by tuple of rendered queries for batches.
+# Handing pyodbc the identical string object on the reused per-thread cursor
+# lets it skip re-preparing a statement it has just run, and identical text
+# lets the SQL Anywhere client statement cache reuse the prepared handle
+# across statements. The IN-list length is fixed for the life of a
+# connection, so no padding is needed to keep the text stable.
+_stmt_cache: dict = {}
 
 
 def _apply_security_filter_to_query(
     base_query: str,
-    users: List[str],
-    additional_params: Optional[List] = None
+    cm: ConnectionManager,
+    additional_params: Optional[Sequence] = None
 ) -> tuple:
     """
     Apply security filtering to a query with authorized users.
 
     This helper function eliminates repeated code for building SQL queries
-    with user authorization filters.
+    with user authorization filters. The {users_filter} placeholder expands to
+    one integer parameter per authorized user_id, compared against the
+    object's creator column so no SYSUSER join is needed. With exactly one
+    authorized user, "IN ({users_filter})" is rendered as "= ?" instead.
 
     Args:
-        base_query: SQL query with {users_filter} placeholder
-        users: List of authorized user names
+        base_query: SQL query with one or more {users_filter} placeholders,
+            each following any additional parameters
+        cm: Connection manager holding the authorized users
         additional_params: Optional additional query parameters
 
     Returns:
-        Tuple of (query_with_filters, params) ready for cursor.execute()
+        Tuple of (query_with_filters, params_tuple) ready for cursor.execute()
     """
-    users_filter = _build_authorized_users_filter(users)
-    query = base_query.replace("{users_filter}", users_filter)
-
+    user_ids, placeholders = cm.authorized_user_filter
+    key = (base_query, placeholders)
+
+    query = _stmt_cache.get(key)
+    if query is None:
+        query = base_query
+        if len(user_ids) == 1:
+            # A single authorized user gets a plain equality predicate
+            query = query.replace("IN ({users_filter})", "= ?")
+        query = _stmt_cache[key] = query.replace("{users_filter}", placeholders)
+
+    filter_count = base_query.count("{users_filter}")
     if additional_params:
-        params = additional_params + users
+        params = (*additional_params, *(user_ids * filter_count))
     else:
-        params = users
+        params = user_ids * filter_count
 
     return query, params
 
 
+def _execute_batch(cursor: pyodbc.Cursor, operation: str, statements: List[tuple]) -> List[list]:
+    """
+    Execute several SELECT statements in a single round-trip.
+
+    The statements are sent to the server as one semicolon-separated batch and
+    each result set is collected by walking cursor.nextset().
+
+    Args:
+        cursor: Open database cursor
+        operation: Name of the batch, used in error messages
+        statements: List of (query, params) tuples as returned by
+            _apply_security_filter_to_query()
+
+    Returns:
+        List of fetched rows, one entry per statement, in statement order
+
+    Raises:
+        DatabaseError: If the driver returns fewer result sets than statements
+    """
+    queries = tuple(query for query, _ in statements)
+    batch_sql = _stmt_cache.get(queries)
+    if batch_sql is None:
+        batch_sql = _stmt_cache[queries] = ";\n".join(query.strip() for query in queries)
+    batch_params = [param for _, params in statements for param in params]
+
+    cursor.execute(batch_sql, batch_params)
+    results = [cursor.fetchall()]
+    while len(results) < len(statements) and cursor.nextset():
+        results.append(cursor.fetchall())
+
+    if len(results) != len(statements):
+        raise DatabaseError(
+            f"{operation} batch",
+            RuntimeError(f"expected {len(statements)} result sets, got {len(results)}")
+        )
+
+    return results
+
+
 def _parse_object_name(name: str) -> str:
     """
     Extract object name from owner.table or owner.view or owner.procedure format.
@@ -93,9 +154,15 @@ def _parse_object_name(name: str) -> str:
     return name.strip()
 
 
-def get_connection_and_cursor():
+def get_connection_and_cursor(arraysize: int = _DETAILS_ARRAYSIZE):
     """
-    Get database connection and cursor with consistent error handling.
+    Check out a pooled database connection and its reusable cursor.
+
+    Callers must hand the cursor back with cm.release_cursor() rather than
+    closing it.
+
+    Args:
+        arraysize: Number of rows the cursor fetches per block
 
     Returns:
         Tuple of (connection_manager, connection, cursor)
@@ -104,189 +171,376 @@ def get_connection_and_cursor():
         DatabaseError: If connection fails
     """
     cm = get_connection_manager()
-    conn = cm.connect()
-    cursor = conn.cursor()
+    cursor = cm.get_cursor()
+    conn = cursor.connection
+    cursor.arraysize = arraysize
     return cm, conn, cursor
 
 
 # ============================================================================
-# Schema Discovery Tools
+# Metadata Cache
 # ============================================================================
 
-async def list_tables(
+# Parsed catalog rows for the list_* and get_*_details tools and
+# list_all_schema(), keyed on (object_type, object_name, authorized_owners)
+_metadata_cache = TTLCache(maxsize=512)
+
+# Object counts go stale faster than object definitions, so database info is
+# kept for a shorter time than other metadata
+_DATABASE_INFO_CACHE_TTL = 30
+
+
+def invalidate_cache() -> None:
+    """
+    Clear all cached schema metadata.
+
+    Call after DDL changes so subsequent lookups see the new schema.
+    """
+    _metadata_cache.clear()
+
+
+def invalidate_object_metadata(object_names: Iterable[str]) -> None:
+    """
+    Drop cached table and view details for the given objects.
+
+    Listings and database info are left to expire on their own TTL.
+
+    Args:
+        object_names: Table or view names, optionally owner-qualified
+    """
+    cm = get_connection_manager()
+    for object_name in object_names:
+        name = _parse_object_name(object_name)
+        for object_type in ("table", "view"):
+            _metadata_cache.discard(_metadata_cache_key(cm, object_type, name))
+
+
+def _get_cached_metadata(
+    object_type: str,
+    object_name: str,
+    fetch: Callable[[str], tuple],
+    ttl: Optional[float] = None
+) -> tuple:
+    """
+    Get object metadata from the cache, fetching it from the database on a miss.
+
+    Args:
+        object_type: Type of object (table, view, procedure, index)
+        object_name: Name of the object
+        fetch: Function that fetches the metadata rows for object_name
+        ttl: Optional shorter time-to-live in seconds (never exceeds the
+            configured schema cache TTL)
+
+    Returns:
+        Metadata rows as returned by fetch
+    """
+    cm = get_connection_manager()
+    key = _metadata_cache_key(cm, object_type, object_name)
+
+    metadata = _metadata_cache.get(key)
+    if metadata is None:
+        metadata = fetch(object_name)
+        cache_ttl = cm.schema_cache_ttl if ttl is None else min(ttl, cm.schema_cache_ttl)
+        _metadata_cache.put(key, metadata, cache_ttl)
+
+    return metadata
+
+
+def _metadata_cache_key(cm: ConnectionManager, object_type: str, object_name: str) -> tuple:
+    """
+    Build the metadata cache key for an object.
+
+    Args:
+        cm: Connection manager holding the authorized users
+        object_type: Type of object (table, view, procedure, index, listing)
+        object_name: Name of the object
+
+    Returns:
+        Cache key scoped to the authorized users
+    """
+    return (object_type, object_name, cm.authorized_owners)
+
+
+def _list_cache_name(
     owner: Optional[str] = None,
     search: Optional[str] = None,
-    limit: int = 100,
-    offset: int = 0,
-    response_format: ResponseFormat = ResponseFormat.MARKDOWN
+    top: Optional[int] = None
 ) -> str:
     """
-    List all tables in the database.
+    Build the metadata cache name for a filtered object listing.
 
-    Uses modern SQL Anywhere system views (SYS.SYSTAB) with security filtering.
+    Args:
+        owner: Owner filter (optional)
+        search: Name substring filter (optional)
+        top: Row limit applied by the listing query itself (optional)
+
+    Returns:
+        Cache name that distinguishes owner filters from search filters
+    """
+    if search:
+        name = f"search:{search}"
+    elif owner:
+        name = f"owner:{owner}"
+    else:
+        name = "*"
+    return name if top is None else f"{name}#{top}"
+
+
+def _get_warm_listing() -> Optional[tuple]:
+    """
+    Get the schema listing cached by list_all_schema(), without fetching.
+
+    Returns:
+        Tuple of (tables, views, procedures) rows, or None if not cached
+    """
+    cm = get_connection_manager()
+    return _metadata_cache.get(_metadata_cache_key(cm, "listing", "*"))
+
+
+# ============================================================================
+# List Model Builders
+# ============================================================================
+# Catalog rows are trusted, so list items skip per-row validation with
+# model_construct().
+
+def _table_list_models(tables: list) -> List[TableInfo]:
+    """
+    Build TableInfo models for a table listing.
 
     Args:
-        owner: Filter by owner (optional, mutually exclusive with search)
-        search: Case-insensitive substring search on table names (optional, mutually exclusive with owner)
-        limit: Maximum number of tables to return
-        offset: Number of results to skip for pagination (default: 0)
-        response_format: Output format (markdown or json)
+        tables: List of (table_name, owner, table_type, row_count) rows
 
     Returns:
-        Formatted table list in requested format with pagination info
+        List of TableInfo models without column details
+    """
+    return [
+        TableInfo.model_construct(
+            name=table_name,
+            owner=table_owner,
+            table_type=table_type,
+            row_count=row_count,
+            columns=[],
+            primary_keys=[],
+            foreign_keys=[],
+            indexes=[],
+            check_constraints=[]
+        )
+        for table_name, table_owner, table_type, row_count in tables
+    ]
 
-    Raises:
-        ValueError: If both owner and search are provided
+
+def _view_list_models(views: list) -> List[ViewInfo]:
     """
-    # Validate mutually exclusive parameters
-    if owner and search:
-        raise ValueError(
-            "The 'owner' and 'search' parameters cannot be used together. "
-            "Please use one or the other, or neither for all tables."
+    Build ViewInfo models for a view listing.
+
+    Args:
+        views: List of (view_name, owner) rows
+
+    Returns:
+        List of ViewInfo models without definitions
+    """
+    return [
+        ViewInfo.model_construct(
+            name=view_name,
+            owner=view_owner,
+            definition=None
         )
-    cm, conn, cursor = get_connection_and_cursor()
+        for view_name, view_owner in views
+    ]
 
-    try:
-        authorized_users = cm._authorized_users
 
-        # Query SYS.SYSTAB system view for table information
+def _procedure_list_models(procedures: list) -> List[ProcedureInfo]:
+    """
+    Build ProcedureInfo models for a procedure listing.
+
+    Args:
+        procedures: List of (proc_name, owner) rows
+
+    Returns:
+        List of ProcedureInfo models without parameters
+    """
+    return [
+        ProcedureInfo.model_construct(
+            name=proc_name,
+            owner=proc_owner,
+            procedure_type="PROCEDURE",  # Simplified
+            parameters=[],
+            return_type=None,
+            definition=None
+        )
+        for proc_name, proc_owner in procedures
+    ]
+
+
+# ============================================================================
+# Schema Discovery Tools
+# ============================================================================
+
+def _fetch_table_list(owner: Optional[str], search: Optional[str], limit: int) -> list:
+    """
+    Fetch all table rows matching the filters from the system catalog.
+
+    Args:
+        owner: Filter by owner (optional)
+        search: Case-insensitive substring search on table names (optional)
+        limit: Page size, used to size the cursor fetch buffer
+
+    Returns:
+        List of (table_name, owner, table_type, row_count) rows
+    """
+    cm, conn, cursor = get_connection_and_cursor(arraysize=max(limit, _MIN_ARRAYSIZE))
+    failed = False
+
+    try:
+        # Query SYS.SYSTAB for base tables (table_type = 1 = Base table)
         # SECURITY: Only expose tables created by authorized users
         if search:
             # Case-insensitive substring search using LOWER() function
             base_query = """
-                SELECT t.table_name, u.user_name AS owner_name, t.table_type_str, t.count
+                SELECT t.table_name, USER_NAME(t.creator) AS owner_name, t.table_type_str, t.count
                 FROM SYS.SYSTAB t
-                JOIN SYS.SYSUSER u ON t.creator = u.user_id
                 WHERE LOWER(t.table_name) LIKE LOWER(?)
-                  AND t.table_type_str = 'BASE'
-                  AND u.user_name IN ({users_filter})
+                  AND t.table_type = 1
+                  AND t.creator IN ({users_filter})
                 ORDER BY t.table_name
             """
             # Add wildcards for substring matching
             search_pattern = f"%{search}%"
             query, params = _apply_security_filter_to_query(
-                base_query, authorized_users, [search_pattern]
+                base_query, cm, [search_pattern]
             )
         elif owner:
             base_query = """
-                SELECT t.table_name, u.user_name AS owner_name, t.table_type_str, t.count
+                SELECT t.table_name, USER_NAME(t.creator) AS owner_name, t.table_type_str, t.count
                 FROM SYS.SYSTAB t
-                JOIN SYS.SYSUSER u ON t.creator = u.user_id
-                WHERE u.user_name = ?
-                  AND t.table_type_str = 'BASE'
-                  AND u.user_name IN ({users_filter})
+                WHERE t.creator = USER_ID(?)
+                  AND t.table_type = 1
+                  AND t.creator IN ({users_filter})
                 ORDER BY t.table_name
             """
-            query, params = _apply_security_filter_to_query(base_query, authorized_users, [owner])
+            query, params = _apply_security_filter_to_query(base_query, cm, [owner])
         else:
             base_query = """
-                SELECT t.table_name, u.user_name AS owner_name, t.table_type_str, t.count
+                SELECT t.table_name, USER_NAME(t.creator) AS owner_name, t.table_type_str, t.count
                 FROM SYS.SYSTAB t
-                JOIN SYS.SYSUSER u ON t.creator = u.user_id
-                WHERE t.table_type_str = 'BASE'
-                  AND u.user_name IN ({users_filter})
+                WHERE t.table_type = 1
+                  AND t.creator IN ({users_filter})
                 ORDER BY t.table_name
             """
-            query, params = _apply_security_filter_to_query(base_query, authorized_users)
+            query, params = _apply_security_filter_to_query(base_query, cm)
 
         # Execute query to get all matching tables (for total count)
         cursor.execute(query, params)
-        all_tables = cursor.fetchall()
-        total_count = len(all_tables)
-
-        # Apply offset and limit for pagination
-        start_index = offset
-        end_index = offset + limit
-        tables = all_tables[start_index:end_index]
-
-        # Calculate pagination info
-        count = len(tables)
-        has_more = total_count > offset + limit
-        next_offset = offset + limit if has_more else None
-
-        # Format output based on response_format
-        if response_format == ResponseFormat.JSON:
-            # Convert to Pydantic models and return JSON
-            table_models = []
-            for table_name, table_owner, table_type, row_count in tables:
-                table_models.append(
-                    TableInfo(
-                        name=table_name,
-                        owner=table_owner,
-                        table_type=table_type,
-                        row_count=row_count,
-                        columns=[],
-                        primary_keys=[],
-                        foreign_keys=[],
-                        indexes=[],
-                        check_constraints=[]
-                    )
-                )
-
-            response = TableListResponse(
-                tables=table_models,
-                total_count=total_count,
-                count=count,
-                offset=offset,
-                has_more=has_more,
-                next_offset=next_offset
-            )
-            return response.model_dump_json(indent=2)
-        else:
-            # Use formatter for markdown with pagination info
-            return formatters.format_table_list_markdown_with_pagination(
-                tables, total_count, count, offset, has_more, next_offset
-            )
+        return cursor.fetchall()
+
+    except pyodbc.Error:
+        # Probe the connection before it is used again
+        failed = True
+        raise
 
     finally:
-        cursor.close()
+        cm.release_cursor(cursor, failed=failed)
 
 
-async def get_table_details(
-    table_name: str,
+async def list_tables(
+    owner: Optional[str] = None,
+    search: Optional[str] = None,
+    limit: int = 100,
+    offset: int = 0,
     response_format: ResponseFormat = ResponseFormat.MARKDOWN
 ) -> str:
     """
-    Get comprehensive metadata for a specific table.
+    List all tables in the database.
 
-    Uses modern SQL Anywhere system views with security filtering.
+    Uses modern SQL Anywhere system views (SYS.SYSTAB) with security filtering.
 
     Args:
-        table_name: Name of the table (can include owner prefix, e.g., 'monitor.Part' or 'Part')
+        owner: Filter by owner (optional, mutually exclusive with search)
+        search: Case-insensitive substring search on table names (optional, mutually exclusive with owner)
+        limit: Maximum number of tables to return
+        offset: Number of results to skip for pagination (default: 0)
+        response_format: Output format (markdown or json)
 
     Returns:
-        Markdown formatted table details
+        Formatted table list in requested format with pagination info
+
+    Raises:
+        ValueError: If both owner and search are provided
     """
-    # Extract table name if owner prefix is provided (e.g., 'monitor.Part' -> 'Part')
-    table_name = _parse_object_name(table_name)
+    # Validate mutually exclusive parameters
+    if owner and search:
+        raise ValueError(
+            "The 'owner' and 'search' parameters cannot be used together. "
+            "Please use one or the other, or neither for all tables."
+        )
+
+    # Serve the unfiltered listing from a warm list_all_schema() result
+    listing = None if owner or search else _get_warm_listing()
+    if listing is not None:
+        all_tables = listing[0]
+    else:
+        all_tables = await run_in_db_thread(
+            _get_cached_metadata, "table_list", _list_cache_name(owner, search),
+            lambda _: _fetch_table_list(owner, search, limit)
+        )
+
+    # Apply offset and limit for pagination
+    total_count = len(all_tables)
+    tables = all_tables[offset:offset + limit]
+
+    # Calculate pagination info
+    count = len(tables)
+    has_more = total_count > offset + limit
+    next_offset = offset + limit if has_more else None
+
+    # Format output based on response_format
+    if response_format == ResponseFormat.JSON:
+        # Convert to Pydantic models and return JSON
+        table_models = _table_list_models(tables)
+
+        response = TableListResponse(
+            tables=table_models,
+            total_count=total_count,
+            count=count,
+            offset=offset,
+            has_more=has_more,
+            next_offset=next_offset
+        )
+        return formatters.to_json(response)
+    else:
+        # Use formatter for markdown with pagination info
+        return formatters.format_table_list_markdown_with_pagination(
+            tables, total_count, count, offset, has_more, next_offset
+        )
+
+
+def _fetch_table_metadata(table_name: str) -> tuple:
+    """
+    Fetch table metadata rows from the system catalog.
+
+    Args:
+        table_name: Name of the table
+
+    Returns:
+        Tuple of (table_info, columns, primary_keys, foreign_keys, indexes) rows
 
+    Raises:
+        DatabaseNotFoundError: If the table does not exist or is not authorized
+    """
     cm, conn, cursor = get_connection_and_cursor()
+    failed = False
 
     try:
-        # Get table basic info with security filter
-        authorized_users = cm._authorized_users
-
+        # Get table basic info, columns, foreign keys and indexes (including
+        # primary keys) with security filter. All four queries are sent as one batch.
         base_query = """
-            SELECT t.table_name, u.user_name AS owner_name, t.table_type_str, t.count
+            SELECT t.table_name, USER_NAME(t.creator) AS owner_name, t.table_type_str, t.count
             FROM SYS.SYSTAB t
-            JOIN SYS.SYSUSER u ON t.creator = u.user_id
             WHERE t.table_name = ?
-              AND u.user_name IN ({users_filter})
+              AND t.creator IN ({users_filter})
         """
-        query, params = _apply_security_filter_to_query(base_query, authorized_users, [table_name])
-        cursor.execute(query, params)
-        table_info = cursor.fetchone()
-
-        if not table_info:
-            raise DatabaseNotFoundError("table", table_name)
-
-        # Extract table info
-        table_name_result = table_info[0]
-        owner_name = table_info[1]
-        table_type = table_info[2]
-        row_count = table_info[3]
 
-        # Get columns using SYS.SYSTABCOL with security filter
+        # Columns using SYS.SYSTABCOL, flagged when part of the primary key
         col_query = """
             SELECT
                 sc.column_name,
@@ -294,76 +548,23 @@ async def get_table_details(
                 sc.width,
                 sc.scale,
                 sc.nulls,
-                sc."default" AS default_value
+                sc."default" AS default_value,
+                CASE WHEN pk.column_id IS NULL THEN 'N' ELSE 'Y' END AS is_pk
             FROM SYS.SYSTABCOL sc
             JOIN SYS.SYSDOMAIN d ON sc.domain_id = d.domain_id
             JOIN SYS.SYSTAB t ON sc.table_id = t.table_id
-            JOIN SYS.SYSUSER u ON t.creator = u.user_id
+            LEFT JOIN (
+                SELECT ic.table_id, ic.column_id
+                FROM SYS.SYSIDX i
+                JOIN SYS.SYSIDXCOL ic ON i.index_id = ic.index_id AND i.table_id = ic.table_id
+                WHERE i.index_category = 1
+            ) pk ON pk.table_id = sc.table_id AND pk.column_id = sc.column_id
             WHERE t.table_name = ?
-              AND u.user_name IN ({users_filter})
+              AND t.creator IN ({users_filter})
             ORDER BY sc.column_id
         """
-        query, params = _apply_security_filter_to_query(col_query, authorized_users, [table_name])
-        cursor.execute(query, params)
-        columns_data = cursor.fetchall()
-
-        # Build ColumnInfo models
-        column_models = []
-        for col in columns_data:
-            col_name, domain_id, width, scale, nulls, default_val = col
-            column_models.append(
-                ColumnInfo(
-                    name=col_name,
-                    type=domain_id,
-                    length=width,
-                    scale=scale,
-                    nullable=(nulls == "Y"),
-                    default_value=default_val,
-                    is_primary_key=False  # Will update below
-                )
-            )
-
-        # Get primary keys using SYS.SYSIDX (index_category = 1)
-        pk_query = """
-            SELECT i.index_name, stc.column_name
-            FROM SYS.SYSIDX i
-            JOIN SYS.SYSIDXCOL ic ON i.index_id = ic.index_id AND i.table_id = ic.table_id
-            JOIN SYS.SYSTABCOL stc ON ic.table_id = stc.table_id AND ic.column_id = stc.column_id
-            JOIN SYS.SYSTAB t ON i.table_id = t.table_id
-            JOIN SYS.SYSUSER u ON t.creator = u.user_id
-            WHERE t.table_name = ?
-              AND i.index_category = 1
-              AND u.user_name IN ({users_filter})
-            ORDER BY i.index_name, ic.sequence
-        """
-        query, params = _apply_security_filter_to_query(pk_query, authorized_users, [table_name])
-        cursor.execute(query, params)
-        pkeys_data = cursor.fetchall()
-
-        # Build PrimaryKeyInfo models and mark primary key columns
-        pk_models = []
-        pk_columns = set()
-        pk_dict = {}
-        for pk_name, col_name in pkeys_data:
-            if pk_name not in pk_dict:
-                pk_dict[pk_name] = []
-            pk_dict[pk_name].append(col_name)
-            pk_columns.add(col_name)
-
-        for pk_name, cols in pk_dict.items():
-            pk_models.append(
-                PrimaryKeyInfo(
-                    name=pk_name,
-                    column_names=cols
-                )
-            )
-
-        # Update is_primary_key flag in columns
-        for col in column_models:
-            if col.name in pk_columns:
-                col.is_primary_key = True
 
-        # Get foreign keys using SYS.SYSFKEY
+        # Foreign keys using SYS.SYSFKEY
         fk_query = """
             SELECT
                 fi.index_name AS foreign_key_name,
@@ -374,247 +575,330 @@ async def get_table_details(
             JOIN SYS.SYSTAB pt ON fk.primary_table_id = pt.table_id
             JOIN SYS.SYSIDX fi ON fk.foreign_index_id = fi.index_id AND fk.foreign_table_id = fi.table_id
             JOIN SYS.SYSIDX pi ON fk.primary_index_id = pi.index_id AND fk.primary_table_id = pi.table_id
-            JOIN SYS.SYSUSER u ON ft.creator = u.user_id
             WHERE ft.table_name = ?
-              AND u.user_name IN ({users_filter})
+              AND ft.creator IN ({users_filter})
             ORDER BY fi.index_name
         """
-        query, params = _apply_security_filter_to_query(fk_query, authorized_users, [table_name])
-        cursor.execute(query, params)
-        fkeys_data = cursor.fetchall()
-
-        # Build ForeignKeyInfo models
-        fk_models = []
-        for fk_name, primary_table, primary_key in fkeys_data:
-            fk_models.append(
-                ForeignKeyInfo(
-                    name=fk_name,
-                    column_names=[],  # Simplified - would need additional query
-                    referenced_table=primary_table,
-                    referenced_columns=[],  # Simplified
-                    on_delete=None,
-                    on_update=None
-                )
-            )
 
-        # Get indexes using SYS.SYSIDX
+        # Indexes using SYS.SYSIDX (primary keys are index_category = 1)
         idx_query = """
-            SELECT i.index_name, i."unique", stc.column_name, ic."order"
+            SELECT i.index_name, i."unique", stc.column_name, ic."order", i.index_category
             FROM SYS.SYSIDX i
             JOIN SYS.SYSIDXCOL ic ON i.index_id = ic.index_id AND i.table_id = ic.table_id
             JOIN SYS.SYSTABCOL stc ON ic.table_id = stc.table_id AND ic.column_id = stc.column_id
             JOIN SYS.SYSTAB t ON i.table_id = t.table_id
-            JOIN SYS.SYSUSER u ON t.creator = u.user_id
             WHERE t.table_name = ?
-              AND u.user_name IN ({users_filter})
+              AND t.creator IN ({users_filter})
             ORDER BY i.index_name, ic.sequence
         """
-        query, params = _apply_security_filter_to_query(idx_query, authorized_users, [table_name])
-        cursor.execute(query, params)
-        indexes_data = cursor.fetchall()
-
-        # Build IndexInfo models
-        idx_models = []
-        idx_dict = {}
-        for idx_name, unique, col_name, order_val in indexes_data:
-            if idx_name not in idx_dict:
-                idx_dict[idx_name] = {"unique": unique, "columns": []}
-            idx_dict[idx_name]["columns"].append(
-                IndexColumn(
-                    column_name=col_name,
-                    order="ASC" if order_val == "A" else "DESC"
-                )
-            )
 
-        for idx_name, idx_info in idx_dict.items():
-            idx_models.append(
-                IndexInfo(
-                    name=idx_name,
-                    table_name=table_name,
-                    is_unique=(idx_info["unique"] == "Y"),
-                    is_primary_key=False,  # Would need additional check
-                    columns=idx_info["columns"],
-                    index_type=None
-                )
-            )
+        info_rows, columns_data, fkeys_data, idx_rows = _execute_batch(
+            cursor,
+            "table details",
+            [
+                _apply_security_filter_to_query(query, cm, [table_name])
+                for query in (base_query, col_query, fk_query, idx_query)
+            ]
+        )
 
-        # Format output based on response_format
-        if response_format == ResponseFormat.JSON:
-            # Build complete TableInfo model
-            table_model = TableInfo(
-                name=table_name_result,
-                owner=owner_name,
-                table_type=table_type,
-                row_count=row_count,
-                columns=column_models,
-                primary_keys=pk_models,
-                foreign_keys=fk_models,
-                indexes=idx_models,
-                check_constraints=[]  # Not implemented yet
-            )
-            return table_model.model_dump_json(indent=2)
-        else:
-            # Use formatter for markdown
-            return formatters.format_table_details_markdown(
-                table_name=table_name_result,
-                owner=owner_name,
-                table_type=table_type,
-                row_count=row_count,
-                columns=columns_data,
-                primary_keys=pkeys_data,
-                foreign_keys=fkeys_data,
-                indexes=indexes_data
-            )
+        if not info_rows:
+            raise DatabaseNotFoundError("table", table_name)
+
+        # Split primary key columns out of the index rows
+        pkeys_data = []
+        indexes_data = []
+        for idx_name, unique, col_name, order_val, category in idx_rows:
+            if category == 1:
+                pkeys_data.append((idx_name, col_name))
+            indexes_data.append((idx_name, unique, col_name, order_val))
+
+        return info_rows[0], columns_data, pkeys_data, fkeys_data, indexes_data
+
+    except pyodbc.Error:
+        # Probe the connection before it is used again
+        failed = True
+        raise
 
     finally:
-        cursor.close()
+        cm.release_cursor(cursor, failed=failed)
 
 
-async def list_views(
-    owner: Optional[str] = None,
-    search: Optional[str] = None,
-    limit: int = 100,
+async def get_table_details(
+    table_name: str,
     response_format: ResponseFormat = ResponseFormat.MARKDOWN
 ) -> str:
     """
-    List all views in the database.
+    Get comprehensive metadata for a specific table.
 
-    Uses modern SQL Anywhere system views (SYS.SYSTAB) with security filtering.
+    Uses modern SQL Anywhere system views with security filtering.
 
     Args:
-        owner: Filter by owner (optional, mutually exclusive with search)
-        search: Case-insensitive substring search on view names (optional, mutually exclusive with owner)
-        limit: Maximum number of views to return
-        response_format: Output format (markdown or json)
+        table_name: Name of the table (can include owner prefix, e.g., 'monitor.Part' or 'Part')
 
     Returns:
-        Formatted view list in requested format
-
-    Raises:
-        ValueError: If both owner and search are provided
+        Markdown formatted table details
     """
-    # Validate mutually exclusive parameters
-    if owner and search:
-        raise ValueError(
-            "The 'owner' and 'search' parameters cannot be used together. "
-            "Please use one or the other, or neither for all views."
+    # Extract table name if owner prefix is provided (e.g., 'monitor.Part' -> 'Part')
+    table_name = _parse_object_name(table_name)
+
+    # Run the blocking catalog fetch on a database thread so the event loop
+    # keeps serving other requests while waiting on the database
+    table_info, columns_data, pkeys_data, fkeys_data, indexes_data = await run_in_db_thread(
+        _get_cached_metadata, "table", table_name, _fetch_table_metadata
+    )
+
+    # Extract table info
+    table_name_result = table_info[0]
+    owner_name = table_info[1]
+    table_type = table_info[2]
+    row_count = table_info[3]
+
+    # Group primary key columns by constraint name
+    pk_dict = defaultdict(list)
+    for pk_name, col_name in pkeys_data:
+        pk_dict[pk_name].append(col_name)
+
+    pk_models = [
+        PrimaryKeyInfo(
+            name=pk_name,
+            column_names=cols
+        )
+        for pk_name, cols in pk_dict.items()
+    ]
+
+    # Build ColumnInfo models
+    column_models = []
+    for col in columns_data:
+        col_name, domain_id, width, scale, nulls, default_val, is_pk = col
+        column_models.append(
+            ColumnInfo(
+                name=col_name,
+                type=domain_id,
+                length=width,
+                scale=scale,
+                nullable=(nulls == "Y"),
+                default_value=default_val,
+                is_primary_key=(is_pk == "Y")
+            )
         )
-    cm, conn, cursor = get_connection_and_cursor()
 
-    try:
-        authorized_users = cm._authorized_users
+    # Build ForeignKeyInfo models
+    fk_models = []
+    for fk_name, primary_table, primary_key in fkeys_data:
+        fk_models.append(
+            ForeignKeyInfo(
+                name=fk_name,
+                column_names=[],  # Simplified - would need additional query
+                referenced_table=primary_table,
+                referenced_columns=[],  # Simplified
+                on_delete=None,
+                on_update=None
+            )
+        )
 
-        # Query SYS.SYSTAB for views (table_type = 21 = View)
-        # SECURITY: Only expose views created by authorized users
-        if search:
-            # Case-insensitive substring search using LOWER() function
-            base_query = """
-                SELECT t.table_name AS view_name, u.user_name AS owner_name
-                FROM SYS.SYSTAB t
-                JOIN SYS.SYSUSER u ON t.creator = u.user_id
-                WHERE LOWER(t.table_name) LIKE LOWER(?)
-                  AND t.table_type_str = 'VIEW'
-                  AND u.user_name IN ({users_filter})
+    # Build IndexInfo models
+    idx_models = []
+    idx_unique = {}
+    idx_columns = defaultdict(list)
+    for idx_name, unique, col_name, order_val in indexes_data:
+        idx_unique.setdefault(idx_name, unique)
+        idx_columns[idx_name].append(
+            IndexColumn.model_construct(
+                column_name=col_name,
+                order=_ORDER_MAP.get(order_val, "DESC")
+            )
+        )
+
+    for idx_name, columns in idx_columns.items():
+        idx_models.append(
+            IndexInfo(
+                name=idx_name,
+                table_name=table_name,
+                is_unique=(idx_unique[idx_name] == "Y"),
+                is_primary_key=False,  # Would need additional check
+                columns=columns,
+                index_type=None
+            )
+        )
+
+    # Format output based on response_format
+    if response_format == ResponseFormat.JSON:
+        # Build complete TableInfo model
+        table_model = TableInfo(
+            name=table_name_result,
+            owner=owner_name,
+            table_type=table_type,
+            row_count=row_count,
+            columns=column_models,
+            primary_keys=pk_models,
+            foreign_keys=fk_models,
+            indexes=idx_models,
+            check_constraints=[]  # Not implemented yet
+        )
+        return formatters.to_json(table_model)
+    else:
+        # Use formatter for markdown
+        return formatters.format_table_details_markdown(
+            table_name=table_name_result,
+            owner=owner_name,
+            table_type=table_type,
+            row_count=row_count,
+            columns=columns_data,
+            primary_keys=pkeys_data,
+            foreign_keys=fkeys_data,
+            indexes=indexes_data
+        )
+
+
+def _fetch_view_list(owner: Optional[str], search: Optional[str], limit: int) -> list:
+    """
+    Fetch view rows matching the filters from the system catalog.
+
+    Args:
+        owner: Filter by owner (optional)
+        search: Case-insensitive substring search on view names (optional)
+        limit: Maximum number of views to return (already clamped)
+
+    Returns:
+        List of (view_name, owner) rows
+    """
+    cm, conn, cursor = get_connection_and_cursor(arraysize=max(limit, _MIN_ARRAYSIZE))
+    failed = False
+
+    try:
+        # Query SYS.SYSTAB for views (table_type = 21 = View)
+        # SECURITY: Only expose views created by authorized users
+        if search:
+            # Case-insensitive substring search using LOWER() function
+            base_query = """
+                SELECT TOP ? t.table_name AS view_name, USER_NAME(t.creator) AS owner_name
+                FROM SYS.SYSTAB t
+                WHERE LOWER(t.table_name) LIKE LOWER(?)
+                  AND t.table_type = 21
+                  AND t.creator IN ({users_filter})
                 ORDER BY t.table_name
             """
             # Add wildcards for substring matching
             search_pattern = f"%{search}%"
             query, params = _apply_security_filter_to_query(
-                base_query, authorized_users, [search_pattern]
+                base_query, cm, [limit, search_pattern]
             )
         elif owner:
             base_query = """
-                SELECT t.table_name AS view_name, u.user_name AS owner_name
+                SELECT TOP ? t.table_name AS view_name, USER_NAME(t.creator) AS owner_name
                 FROM SYS.SYSTAB t
-                JOIN SYS.SYSUSER u ON t.creator = u.user_id
-                WHERE u.user_name = ?
-                  AND t.table_type_str = 'VIEW'
-                  AND u.user_name IN ({users_filter})
+                WHERE t.creator = USER_ID(?)
+                  AND t.table_type = 21
+                  AND t.creator IN ({users_filter})
                 ORDER BY t.table_name
             """
-            query, params = _apply_security_filter_to_query(base_query, authorized_users, [owner])
+            query, params = _apply_security_filter_to_query(base_query, cm, [limit, owner])
         else:
             base_query = """
-                SELECT t.table_name AS view_name, u.user_name AS owner_name
+                SELECT TOP ? t.table_name AS view_name, USER_NAME(t.creator) AS owner_name
                 FROM SYS.SYSTAB t
-                JOIN SYS.SYSUSER u ON t.creator = u.user_id
-                WHERE t.table_type_str = 'VIEW'
-                  AND u.user_name IN ({users_filter})
+                WHERE t.table_type = 21
+                  AND t.creator IN ({users_filter})
                 ORDER BY t.table_name
             """
-            query, params = _apply_security_filter_to_query(base_query, authorized_users)
+            query, params = _apply_security_filter_to_query(base_query, cm, [limit])
 
         cursor.execute(query, params)
+        return cursor.fetchall()
 
-        views = cursor.fetchmany(limit)
-
-        # Format output based on response_format
-        if response_format == ResponseFormat.JSON:
-            # Convert to Pydantic models and return JSON
-            view_models = []
-            for view_name, view_owner in views:
-                view_models.append(
-                    ViewInfo(
-                        name=view_name,
-                        owner=view_owner,
-                        definition=None
-                    )
-                )
-
-            response = ViewListResponse(
-                views=view_models,
-                total_count=len(view_models),
-                has_more=False
-            )
-            return response.model_dump_json(indent=2)
-        else:
-            # Use formatter for markdown
-            return formatters.format_view_list_markdown(views, len(views))
+    except pyodbc.Error:
+        # Probe the connection before it is used again
+        failed = True
+        raise
 
     finally:
-        cursor.close()
+        cm.release_cursor(cursor, failed=failed)
 
 
-async def get_view_details(
-    view_name: str,
+async def list_views(
+    owner: Optional[str] = None,
+    search: Optional[str] = None,
+    limit: int = 100,
     response_format: ResponseFormat = ResponseFormat.MARKDOWN
 ) -> str:
     """
-    Get detailed information about a specific view.
+    List all views in the database.
+
+    Uses modern SQL Anywhere system views (SYS.SYSTAB) with security filtering.
 
     Args:
-        view_name: Name of view (can include owner prefix, e.g., 'monitor.CustomerView' or 'CustomerView')
+        owner: Filter by owner (optional, mutually exclusive with search)
+        search: Case-insensitive substring search on view names (optional, mutually exclusive with owner)
+        limit: Maximum number of views to return
+        response_format: Output format (markdown or json)
 
     Returns:
-        Markdown formatted view details
+        Formatted view list in requested format
+
+    Raises:
+        ValueError: If both owner and search are provided
     """
-    # Extract view name if owner prefix is provided (e.g., 'monitor.CustomerView' -> 'CustomerView')
-    view_name = _parse_object_name(view_name)
+    # Validate mutually exclusive parameters
+    if owner and search:
+        raise ValueError(
+            "The 'owner' and 'search' parameters cannot be used together. "
+            "Please use one or the other, or neither for all views."
+        )
+    # Bind TOP as a parameter so every limit value shares one cached plan
+    if not isinstance(limit, int) or isinstance(limit, bool):
+        raise InvalidParameterError("limit", "must be an integer")
+    limit = max(1, min(limit, get_connection_manager().max_rows_limit))
+
+    # Serve the unfiltered listing from a warm list_all_schema() result
+    listing = None if owner or search else _get_warm_listing()
+    if listing is not None:
+        views = listing[1][:limit]
+    else:
+        views = await run_in_db_thread(
+            _get_cached_metadata, "view_list", _list_cache_name(owner, search, limit),
+            lambda _: _fetch_view_list(owner, search, limit)
+        )
+
+    # Format output based on response_format
+    if response_format == ResponseFormat.JSON:
+        # Convert to Pydantic models and return JSON
+        view_models = _view_list_models(views)
+
+        response = ViewListResponse(
+            views=view_models,
+            total_count=len(view_models),
+            has_more=False
+        )
+        return formatters.to_json(response)
+    else:
+        # Use formatter for markdown
+        return formatters.format_view_list_markdown(views, len(views))
+
+
+def _fetch_view_metadata(view_name: str) -> tuple:
+    """
+    Fetch view metadata rows from the system catalog.
+
+    Args:
+        view_name: Name of the view
 
+    Returns:
+        Tuple of (view_info, columns) rows
+
+    Raises:
+        DatabaseNotFoundError: If the view does not exist or is not authorized
+    """
     cm, conn, cursor = get_connection_and_cursor()
+    failed = False
 
     try:
-        authorized_users = cm._authorized_users
-
         base_query = """
-            SELECT t.table_name, u.user_name AS owner_name
+            SELECT t.table_name, USER_NAME(t.creator) AS owner_name
             FROM SYS.SYSTAB t
-            JOIN SYS.SYSUSER u ON t.creator = u.user_id
             WHERE t.table_name = ?
-              AND t.table_type_str = 'VIEW'
-              AND u.user_name IN ({users_filter})
+              AND t.table_type = 21
+              AND t.creator IN ({users_filter})
         """
-        query, params = _apply_security_filter_to_query(base_query, authorized_users, [view_name])
-
-        cursor.execute(query, params)
-        view_info = cursor.fetchone()
-
-        if not view_info:
-            raise DatabaseNotFoundError("view", view_name)
-
-        # Extract view info
-        view_name_result = view_info[0]
-        owner_name = view_info[1]
 
         # Get columns using SYS.SYSTABCOL with SYS.SYSDOMAIN
         col_query = """
@@ -622,193 +906,233 @@ async def get_view_details(
             FROM SYS.SYSTABCOL sc
             JOIN SYS.SYSDOMAIN d ON sc.domain_id = d.domain_id
             JOIN SYS.SYSTAB t ON sc.table_id = t.table_id
-            JOIN SYS.SYSUSER u ON t.creator = u.user_id
             WHERE t.table_name = ?
-              AND t.table_type_str = 'VIEW'
-              AND u.user_name IN ({users_filter})
+              AND t.table_type = 21
+              AND t.creator IN ({users_filter})
             ORDER BY sc.column_id
         """
-        query, params = _apply_security_filter_to_query(col_query, authorized_users, [view_name])
+        view_rows, columns_data = _execute_batch(
+            cursor,
+            "view details",
+            [
+                _apply_security_filter_to_query(query, cm, [view_name])
+                for query in (base_query, col_query)
+            ]
+        )
 
-        cursor.execute(query, params)
-        columns_data = cursor.fetchall()
-
-        # Build ColumnInfo models
-        column_models = []
-        for col_name, data_type, nulls in columns_data:
-            column_models.append(
-                ColumnInfo(
-                    name=col_name,
-                    type=data_type,
-                    length=None,
-                    scale=None,
-                    nullable=(nulls == "Y"),
-                    default_value=None,
-                    is_primary_key=False
-                )
-            )
+        if not view_rows:
+            raise DatabaseNotFoundError("view", view_name)
 
-        # Format output based on response_format
-        if response_format == ResponseFormat.JSON:
-            # Build ViewInfo model with columns
-            view_model = ViewInfo(
-                name=view_name_result,
-                owner=owner_name,
-                definition=None,  # Would need additional query
-                columns=column_models
-            )
-            return view_model.model_dump_json(indent=2)
-        else:
-            # Use formatter for markdown
-            return formatters.format_view_details_markdown(
-                view_name=view_name_result,
-                owner=owner_name,
-                columns=columns_data
-            )
+        return view_rows[0], columns_data
+
+    except pyodbc.Error:
+        # Probe the connection before it is used again
+        failed = True
+        raise
 
     finally:
-        cursor.close()
+        cm.release_cursor(cursor, failed=failed)
 
 
-async def list_procedures(
-    owner: Optional[str] = None,
-    search: Optional[str] = None,
-    limit: int = 100,
+async def get_view_details(
+    view_name: str,
     response_format: ResponseFormat = ResponseFormat.MARKDOWN
 ) -> str:
     """
-    List all stored procedures and functions.
+    Get detailed information about a specific view.
 
     Args:
-        owner: Filter by owner (optional, mutually exclusive with search)
-        search: Case-insensitive substring search on procedure names (optional, mutually exclusive with owner)
-        limit: Maximum number of procedures to return
-        response_format: Output format (markdown or json)
+        view_name: Name of view (can include owner prefix, e.g., 'monitor.CustomerView' or 'CustomerView')
 
     Returns:
-        Formatted procedure list in requested format
-
-    Raises:
-        ValueError: If both owner and search are provided
+        Markdown formatted view details
     """
-    # Validate mutually exclusive parameters
-    if owner and search:
-        raise ValueError(
-            "The 'owner' and 'search' parameters cannot be used together. "
-            "Please use one or the other, or neither for all procedures."
+    # Extract view name if owner prefix is provided (e.g., 'monitor.CustomerView' -> 'CustomerView')
+    view_name = _parse_object_name(view_name)
+
+    view_info, columns_data = await run_in_db_thread(
+        _get_cached_metadata, "view", view_name, _fetch_view_metadata
+    )
+
+    # Extract view info
+    view_name_result = view_info[0]
+    owner_name = view_info[1]
+
+    # Build ColumnInfo models
+    column_models = []
+    for col_name, data_type, nulls in columns_data:
+        column_models.append(
+            ColumnInfo(
+                name=col_name,
+                type=data_type,
+                length=None,
+                scale=None,
+                nullable=(nulls == "Y"),
+                default_value=None,
+                is_primary_key=False
+            )
+        )
+
+    # Format output based on response_format
+    if response_format == ResponseFormat.JSON:
+        # Build ViewInfo model with columns
+        view_model = ViewInfo(
+            name=view_name_result,
+            owner=owner_name,
+            definition=None,  # Would need additional query
+            columns=column_models
+        )
+        return formatters.to_json(view_model)
+    else:
+        # Use formatter for markdown
+        return formatters.format_view_details_markdown(
+            view_name=view_name_result,
+            owner=owner_name,
+            columns=columns_data
         )
-    cm, conn, cursor = get_connection_and_cursor()
 
-    try:
-        authorized_users = cm._authorized_users
 
+def _fetch_procedure_list(owner: Optional[str], search: Optional[str], limit: int) -> list:
+    """
+    Fetch procedure rows matching the filters from the system catalog.
+
+    Args:
+        owner: Filter by owner (optional)
+        search: Case-insensitive substring search on procedure names (optional)
+        limit: Maximum number of procedures to return (already clamped)
+
+    Returns:
+        List of (proc_name, owner) rows
+    """
+    cm, conn, cursor = get_connection_and_cursor(arraysize=max(limit, _MIN_ARRAYSIZE))
+    failed = False
+
+    try:
         if search:
             # Case-insensitive substring search using LOWER() function
-            base_query = f"""
-                SELECT TOP {limit} p.proc_name, u.user_name AS owner_name
+            base_query = """
+                SELECT TOP ? p.proc_name, USER_NAME(p.creator) AS owner_name
                 FROM SYS.SYSPROCEDURE p
-                JOIN SYS.SYSUSER u ON p.creator = u.user_id
                 WHERE LOWER(p.proc_name) LIKE LOWER(?)
-                  AND u.user_name IN ({{users_filter}})
+                  AND p.creator IN ({users_filter})
                 ORDER BY p.proc_name
             """
             # Add wildcards for substring matching
             search_pattern = f"%{search}%"
             query, params = _apply_security_filter_to_query(
-                base_query, authorized_users, [search_pattern]
+                base_query, cm, [limit, search_pattern]
             )
         elif owner:
-            base_query = f"""
-                SELECT TOP {limit} p.proc_name, u.user_name AS owner_name
+            base_query = """
+                SELECT TOP ? p.proc_name, USER_NAME(p.creator) AS owner_name
                 FROM SYS.SYSPROCEDURE p
-                JOIN SYS.SYSUSER u ON p.creator = u.user_id
-                WHERE u.user_name = ?
-                  AND u.user_name IN ({{users_filter}})
+                WHERE p.creator = USER_ID(?)
+                  AND p.creator IN ({users_filter})
                 ORDER BY p.proc_name
             """
-            query, params = _apply_security_filter_to_query(base_query, authorized_users, [owner])
+            query, params = _apply_security_filter_to_query(base_query, cm, [limit, owner])
         else:
-            base_query = f"""
-                SELECT TOP {limit} p.proc_name, u.user_name AS owner_name
+            base_query = """
+                SELECT TOP ? p.proc_name, USER_NAME(p.creator) AS owner_name
                 FROM SYS.SYSPROCEDURE p
-                JOIN SYS.SYSUSER u ON p.creator = u.user_id
-                WHERE u.user_name IN ({{users_filter}})
+                WHERE p.creator IN ({users_filter})
                 ORDER BY p.proc_name
             """
-            query, params = _apply_security_filter_to_query(base_query, authorized_users)
+            query, params = _apply_security_filter_to_query(base_query, cm, [limit])
 
         cursor.execute(query, params)
-        procedures = cursor.fetchall()
-
-        # Format output based on response_format
-        if response_format == ResponseFormat.JSON:
-            # Convert to Pydantic models and return JSON
-            proc_models = []
-            for proc_name, proc_owner in procedures:
-                proc_models.append(
-                    ProcedureInfo(
-                        name=proc_name,
-                        owner=proc_owner,
-                        procedure_type="PROCEDURE",  # Simplified
-                        parameters=[],
-                        return_type=None,
-                        definition=None
-                    )
-                )
-
-            response = ProcedureListResponse(
-                procedures=proc_models,
-                total_count=len(proc_models),
-                has_more=False
-            )
-            return response.model_dump_json(indent=2)
-        else:
-            # Use formatter for markdown
-            return formatters.format_procedure_list_markdown(procedures, len(procedures))
+        return cursor.fetchall()
+
+    except pyodbc.Error:
+        # Probe the connection before it is used again
+        failed = True
+        raise
 
     finally:
-        cursor.close()
+        cm.release_cursor(cursor, failed=failed)
 
 
-async def get_procedure_details(
-    procedure_name: str,
+async def list_procedures(
+    owner: Optional[str] = None,
+    search: Optional[str] = None,
+    limit: int = 100,
     response_format: ResponseFormat = ResponseFormat.MARKDOWN
 ) -> str:
     """
-    Get detailed information about a specific procedure.
+    List all stored procedures and functions.
 
     Args:
-        procedure_name: Name of procedure (can include owner prefix, e.g., 'monitor.GetUser' or 'GetUser')
+        owner: Filter by owner (optional, mutually exclusive with search)
+        search: Case-insensitive substring search on procedure names (optional, mutually exclusive with owner)
+        limit: Maximum number of procedures to return
+        response_format: Output format (markdown or json)
 
     Returns:
-        Markdown formatted procedure details
+        Formatted procedure list in requested format
+
+    Raises:
+        ValueError: If both owner and search are provided
     """
-    # Extract procedure name if owner prefix is provided (e.g., 'monitor.GetUser' -> 'GetUser')
-    procedure_name = _parse_object_name(procedure_name)
+    # Validate mutually exclusive parameters
+    if owner and search:
+        raise ValueError(
+            "The 'owner' and 'search' parameters cannot be used together. "
+            "Please use one or the other, or neither for all procedures."
+        )
+    # Bind TOP as a parameter so every limit value shares one cached plan
+    if not isinstance(limit, int) or isinstance(limit, bool):
+        raise InvalidParameterError("limit", "must be an integer")
+    limit = max(1, min(limit, get_connection_manager().max_rows_limit))
+
+    # Serve the unfiltered listing from a warm list_all_schema() result
+    listing = None if owner or search else _get_warm_listing()
+    if listing is not None:
+        procedures = listing[2][:limit]
+    else:
+        procedures = await run_in_db_thread(
+            _get_cached_metadata, "procedure_list", _list_cache_name(owner, search, limit),
+            lambda _: _fetch_procedure_list(owner, search, limit)
+        )
+
+    # Format output based on response_format
+    if response_format == ResponseFormat.JSON:
+        # Convert to Pydantic models and return JSON
+        proc_models = _procedure_list_models(procedures)
+
+        response = ProcedureListResponse(
+            procedures=proc_models,
+            total_count=len(proc_models),
+            has_more=False
+        )
+        return formatters.to_json(response)
+    else:
+        # Use formatter for markdown
+        return formatters.format_procedure_list_markdown(procedures, len(procedures))
+
+
+def _fetch_procedure_metadata(procedure_name: str) -> tuple:
+    """
+    Fetch procedure metadata rows from the system catalog.
+
+    Args:
+        procedure_name: Name of the procedure
 
+    Returns:
+        Tuple of (procedure_info, parameters) rows
+
+    Raises:
+        DatabaseNotFoundError: If the procedure does not exist or is not authorized
+    """
     cm, conn, cursor = get_connection_and_cursor()
+    failed = False
 
     try:
-        authorized_users = cm._authorized_users
-
         base_query = """
-            SELECT p.proc_name, u.user_name AS owner_name
+            SELECT p.proc_name, USER_NAME(p.creator) AS owner_name
             FROM SYS.SYSPROCEDURE p
-            JOIN SYS.SYSUSER u ON p.creator = u.user_id
             WHERE p.proc_name = ?
-              AND u.user_name IN ({users_filter})
+              AND p.creator IN ({users_filter})
         """
-        query, params = _apply_security_filter_to_query(base_query, authorized_users, [procedure_name])
-
-        cursor.execute(query, params)
-        proc_info = cursor.fetchone()
-
-        if not proc_info:
-            raise DatabaseNotFoundError("procedure", procedure_name)
-
-        # Extract procedure info
-        proc_name_result = proc_info[0]
-        owner_name = proc_info[1]
 
         # Get parameters using SYS.SYSPROCPARM with SYS.SYSDOMAIN for data types
         param_query = """
@@ -820,199 +1144,241 @@ async def get_procedure_details(
             FROM SYS.SYSPROCPARM pp
             JOIN SYS.SYSDOMAIN d ON pp.domain_id = d.domain_id
             JOIN SYS.SYSPROCEDURE p ON pp.proc_id = p.proc_id
-            JOIN SYS.SYSUSER u ON p.creator = u.user_id
             WHERE p.proc_name = ?
-              AND u.user_name IN ({users_filter})
+              AND p.creator IN ({users_filter})
               AND pp.parm_type = 0
             ORDER BY pp.parm_id
         """
-        query, params = _apply_security_filter_to_query(param_query, authorized_users, [procedure_name])
+        proc_rows, params_data = _execute_batch(
+            cursor,
+            "procedure details",
+            [
+                _apply_security_filter_to_query(query, cm, [procedure_name])
+                for query in (base_query, param_query)
+            ]
+        )
 
-        cursor.execute(query, params)
-        params_data = cursor.fetchall()
-
-        # Build ProcedureParameter models
-        param_models = []
-        for parm_name, data_type, mode_in, mode_out in params_data:
-            # Determine parameter mode
-            if mode_in == 'Y' and mode_out == 'Y':
-                mode = 'INOUT'
-            elif mode_out == 'Y':
-                mode = 'OUT'
-            else:
-                mode = 'IN'
-
-            param_models.append(
-                ProcedureParameter(
-                    name=parm_name,
-                    type=data_type,
-                    mode=mode
-                )
-            )
+        if not proc_rows:
+            raise DatabaseNotFoundError("procedure", procedure_name)
 
-        # Format output based on response_format
-        if response_format == ResponseFormat.JSON:
-            # Build ProcedureInfo model
-            proc_model = ProcedureInfo(
-                name=proc_name_result,
-                owner=owner_name,
-                procedure_type="PROCEDURE",  # Simplified - would need additional query
-                parameters=param_models,
-                return_type=None,  # Functions only - would need additional query
-                definition=None  # Would need additional query
-            )
-            return proc_model.model_dump_json(indent=2)
-        else:
-            # Use formatter for markdown
-            return formatters.format_procedure_details_markdown(
-                procedure_name=proc_name_result,
-                owner=owner_name,
-                parameters=params_data
-            )
+        return proc_rows[0], params_data
+
+    except pyodbc.Error:
+        # Probe the connection before it is used again
+        failed = True
+        raise
 
     finally:
-        cursor.close()
+        cm.release_cursor(cursor, failed=failed)
 
 
-async def list_indexes(
-    search: Optional[str] = None,
-    limit: int = 100,
-    offset: int = 0,
+async def get_procedure_details(
+    procedure_name: str,
     response_format: ResponseFormat = ResponseFormat.MARKDOWN
 ) -> str:
     """
-    List all indexes in the database.
+    Get detailed information about a specific procedure.
 
     Args:
-        search: Search for indexes by name substring (optional)
-        limit: Maximum number of indexes to return
-        offset: Number of results to skip for pagination (default: 0)
-        response_format: Output format (markdown or json)
+        procedure_name: Name of procedure (can include owner prefix, e.g., 'monitor.GetUser' or 'GetUser')
 
     Returns:
-        Formatted index list in requested format with pagination info
+        Markdown formatted procedure details
     """
-    cm, conn, cursor = get_connection_and_cursor()
+    # Extract procedure name if owner prefix is provided (e.g., 'monitor.GetUser' -> 'GetUser')
+    procedure_name = _parse_object_name(procedure_name)
+
+    proc_info, params_data = await run_in_db_thread(
+        _get_cached_metadata, "procedure", procedure_name, _fetch_procedure_metadata
+    )
+
+    # Extract procedure info
+    proc_name_result = proc_info[0]
+    owner_name = proc_info[1]
+
+    # Build ProcedureParameter models
+    param_models = []
+    for parm_name, data_type, mode_in, mode_out in params_data:
+        # Determine parameter mode
+        if mode_in == 'Y' and mode_out == 'Y':
+            mode = 'INOUT'
+        elif mode_out == 'Y':
+            mode = 'OUT'
+        else:
+            mode = 'IN'
+
+        param_models.append(
+            ProcedureParameter(
+                name=parm_name,
+                type=data_type,
+                mode=mode
+            )
+        )
+
+    # Format output based on response_format
+    if response_format == ResponseFormat.JSON:
+        # Build ProcedureInfo model
+        proc_model = ProcedureInfo(
+            name=proc_name_result,
+            owner=owner_name,
+            procedure_type="PROCEDURE",  # Simplified - would need additional query
+            parameters=param_models,
+            return_type=None,  # Functions only - would need additional query
+            definition=None  # Would need additional query
+        )
+        return formatters.to_json(proc_model)
+    else:
+        # Use formatter for markdown
+        return formatters.format_procedure_details_markdown(
+            procedure_name=proc_name_result,
+            owner=owner_name,
+            parameters=params_data
+        )
 
-    try:
-        authorized_users = cm._authorized_users
 
+def _fetch_index_list(search: Optional[str], limit: int) -> list:
+    """
+    Fetch all index rows matching the filters from the system catalog.
+
+    Args:
+        search: Case-insensitive substring search on index names (optional)
+        limit: Page size, used to size the cursor fetch buffer
+
+    Returns:
+        List of (index_name, table_name, unique, owner) rows
+    """
+    cm, conn, cursor = get_connection_and_cursor(arraysize=max(limit, _MIN_ARRAYSIZE))
+    failed = False
+
+    try:
         if search:
             # Case-insensitive substring search using LOWER() function
             base_query = """
-                SELECT i.index_name, t.table_name, i."unique", u.user_name AS owner_name
+                SELECT i.index_name, t.table_name, i."unique", USER_NAME(t.creator) AS owner_name
                 FROM SYS.SYSIDX i
                 JOIN SYS.SYSTAB t ON i.table_id = t.table_id
-                JOIN SYS.SYSUSER u ON t.creator = u.user_id
                 WHERE LOWER(i.index_name) LIKE LOWER(?)
-                  AND u.user_name IN ({users_filter})
+                  AND t.creator IN ({users_filter})
                 ORDER BY i.index_name
             """
             # Add wildcards for substring matching
             search_pattern = f"%{search}%"
             query, params = _apply_security_filter_to_query(
-                base_query, authorized_users, [search_pattern]
+                base_query, cm, [search_pattern]
             )
         else:
             base_query = """
-                SELECT i.index_name, t.table_name, i."unique", u.user_name AS owner_name
+                SELECT i.index_name, t.table_name, i."unique", USER_NAME(t.creator) AS owner_name
                 FROM SYS.SYSIDX i
                 JOIN SYS.SYSTAB t ON i.table_id = t.table_id
-                JOIN SYS.SYSUSER u ON t.creator = u.user_id
-                WHERE u.user_name IN ({users_filter})
+                WHERE t.creator IN ({users_filter})
                 ORDER BY i.index_name
             """
-            query, params = _apply_security_filter_to_query(base_query, authorized_users)
+            query, params = _apply_security_filter_to_query(base_query, cm)
 
-        # Execute query to get all matching indexes (for total count)
+        # Fetch every match; list_indexes() paginates and reports the total
         cursor.execute(query, params)
-        all_indexes = cursor.fetchall()
-        total_count = len(all_indexes)
-
-        # Apply offset and limit for pagination
-        start_index = offset
-        end_index = offset + limit
-        indexes = all_indexes[start_index:end_index]
-
-        # Calculate pagination info
-        count = len(indexes)
-        has_more = total_count > offset + limit
-        next_offset = offset + limit if has_more else None
-
-        # Format output based on response_format
-        if response_format == ResponseFormat.JSON:
-            # Convert to Pydantic models and return JSON
-            index_models = []
-            for idx_name, tbl_name, unique, owner in indexes:
-                index_models.append(
-                    IndexInfo(
-                        name=idx_name,
-                        table_name=tbl_name,
-                        is_unique=(unique == "Y"),
-                        is_primary_key=False,  # Simplified
-                        columns=[],
-                        index_type=None
-                    )
-                )
-
-            response = IndexListResponse(
-                indexes=index_models,
-                total_count=total_count,
-                count=count,
-                offset=offset,
-                has_more=has_more,
-                next_offset=next_offset
-            )
-            return response.model_dump_json(indent=2)
-        else:
-            # Use formatter for markdown with pagination info
-            return formatters.format_index_list_markdown_with_pagination(
-                indexes, total_count, count, offset, has_more, next_offset
-            )
+        return cursor.fetchall()
+
+    except pyodbc.Error:
+        # Probe the connection before it is used again
+        failed = True
+        raise
 
     finally:
-        cursor.close()
+        cm.release_cursor(cursor, failed=failed)
 
 
-async def get_index_details(
-    index_name: str,
+async def list_indexes(
+    search: Optional[str] = None,
+    limit: int = 100,
+    offset: int = 0,
     response_format: ResponseFormat = ResponseFormat.MARKDOWN
 ) -> str:
     """
-    Get detailed information about a specific index.
+    List all indexes in the database.
+
+    Args:
+        search: Search for indexes by name substring (optional)
+        limit: Maximum number of indexes to return
+        offset: Number of results to skip for pagination (default: 0)
+        response_format: Output format (markdown or json)
+
+    Returns:
+        Formatted index list in requested format with pagination info
+    """
+    # Execute query to get all matching indexes (for total count)
+    all_indexes = await run_in_db_thread(
+        _get_cached_metadata, "index_list", _list_cache_name(search=search),
+        lambda _: _fetch_index_list(search, limit)
+    )
+    total_count = len(all_indexes)
+
+    # Apply offset and limit for pagination
+    start_index = offset
+    end_index = offset + limit
+    indexes = all_indexes[start_index:end_index]
+
+    # Calculate pagination info
+    count = len(indexes)
+    has_more = total_count > offset + limit
+    next_offset = offset + limit if has_more else None
+
+    # Format output based on response_format
+    if response_format == ResponseFormat.JSON:
+        # Convert to Pydantic models and return JSON (catalog rows are trusted)
+        index_models = [
+            IndexInfo.model_construct(
+                name=idx_name,
+                table_name=tbl_name,
+                is_unique=(unique == "Y"),
+                is_primary_key=False,  # Simplified
+                columns=[],
+                index_type=None
+            )
+            for idx_name, tbl_name, unique, owner in indexes
+        ]
+
+        response = IndexListResponse(
+            indexes=index_models,
+            total_count=total_count,
+            count=count,
+            offset=offset,
+            has_more=has_more,
+            next_offset=next_offset
+        )
+        return formatters.to_json(response)
+    else:
+        # Use formatter for markdown with pagination info
+        return formatters.format_index_list_markdown_with_pagination(
+            indexes, total_count, count, offset, has_more, next_offset
+        )
+
+
+def _fetch_index_metadata(index_name: str) -> tuple:
+    """
+    Fetch index metadata rows from the system catalog.
 
     Args:
         index_name: Name of the index
 
     Returns:
-        Markdown formatted index details
+        Tuple of (index_info, columns) rows
+
+    Raises:
+        DatabaseNotFoundError: If the index does not exist or is not authorized
     """
     cm, conn, cursor = get_connection_and_cursor()
+    failed = False
 
     try:
-        authorized_users = cm._authorized_users
-
         base_query = """
-            SELECT i.index_name, i."unique", t.table_name, u.user_name AS owner_name
+            SELECT i.index_name, i."unique", t.table_name, USER_NAME(t.creator) AS owner_name
             FROM SYS.SYSIDX i
             JOIN SYS.SYSTAB t ON i.table_id = t.table_id
-            JOIN SYS.SYSUSER u ON t.creator = u.user_id
             WHERE i.index_name = ?
-              AND u.user_name IN ({users_filter})
+              AND t.creator IN ({users_filter})
         """
-        query, params = _apply_security_filter_to_query(base_query, authorized_users, [index_name])
-
-        cursor.execute(query, params)
-        index_info = cursor.fetchone()
-
-        if not index_info:
-            raise DatabaseNotFoundError("index", index_name)
-
-        # Extract index info
-        index_name_result = index_info[0]
-        is_unique = index_info[1]
-        table_name_result = index_info[2]
-        owner_name = index_info[3]
 
         # Get index columns using SYS.SYSIDXCOL
         col_query = """
@@ -1021,142 +1387,304 @@ async def get_index_details(
             JOIN SYS.SYSIDX i ON ic.table_id = i.table_id AND ic.index_id = i.index_id
             JOIN SYS.SYSTABCOL stc ON ic.table_id = stc.table_id AND ic.column_id = stc.column_id
             JOIN SYS.SYSTAB t ON i.table_id = t.table_id
-            JOIN SYS.SYSUSER u ON t.creator = u.user_id
             WHERE i.index_name = ?
-              AND u.user_name IN ({users_filter})
+              AND t.creator IN ({users_filter})
             ORDER BY ic.sequence
         """
-        query, params = _apply_security_filter_to_query(col_query, authorized_users, [index_name])
+        index_rows, columns_data = _execute_batch(
+            cursor,
+            "index details",
+            [
+                _apply_security_filter_to_query(query, cm, [index_name])
+                for query in (base_query, col_query)
+            ]
+        )
 
-        cursor.execute(query, params)
-        columns_data = cursor.fetchall()
-
-        # Build IndexColumn models
-        column_models = []
-        for col_name, order_val, seq in columns_data:
-            column_models.append(
-                IndexColumn(
-                    column_name=col_name,
-                    order="ASC" if order_val == "A" else "DESC"
-                )
-            )
+        if not index_rows:
+            raise DatabaseNotFoundError("index", index_name)
 
-        # Format output based on response_format
-        if response_format == ResponseFormat.JSON:
-            # Build IndexInfo model
-            index_model = IndexInfo(
-                name=index_name_result,
-                table_name=table_name_result,
-                is_unique=(is_unique == "Y"),
-                is_primary_key=False,  # Would need additional check
-                columns=column_models,
-                index_type=None
-            )
-            return index_model.model_dump_json(indent=2)
-        else:
-            # Use formatter for markdown
-            return formatters.format_index_details_markdown(
-                index_name=index_name_result,
-                table_name=table_name_result,
-                owner=owner_name,
-                is_unique=(is_unique == "Y"),
-                columns=columns_data
+        return index_rows[0], columns_data
+
+    except pyodbc.Error:
+        # Probe the connection before it is used again
+        failed = True
+        raise
+
+    finally:
+        cm.release_cursor(cursor, failed=failed)
+
+
+async def get_index_details(
+    index_name: str,
+    response_format: ResponseFormat = ResponseFormat.MARKDOWN
+) -> str:
+    """
+    Get detailed information about a specific index.
+
+    Args:
+        index_name: Name of the index
+
+    Returns:
+        Markdown formatted index details
+    """
+    index_info, columns_data = await run_in_db_thread(
+        _get_cached_metadata, "index", index_name, _fetch_index_metadata
+    )
+
+    # Extract index info
+    index_name_result = index_info[0]
+    is_unique = index_info[1]
+    table_name_result = index_info[2]
+    owner_name = index_info[3]
+
+    # Build IndexColumn models
+    column_models = []
+    for col_name, order_val, seq in columns_data:
+        column_models.append(
+            IndexColumn.model_construct(
+                column_name=col_name,
+                order=_ORDER_MAP.get(order_val, "DESC")
             )
+        )
+
+    # Format output based on response_format
+    if response_format == ResponseFormat.JSON:
+        # Build IndexInfo model
+        index_model = IndexInfo(
+            name=index_name_result,
+            table_name=table_name_result,
+            is_unique=(is_unique == "Y"),
+            is_primary_key=False,  # Would need additional check
+            columns=column_models,
+            index_type=None
+        )
+        return formatters.to_json(index_model)
+    else:
+        # Use formatter for markdown
+        return formatters.format_index_details_markdown(
+            index_name=index_name_result,
+            table_name=table_name_result,
+            owner=owner_name,
+            is_unique=(is_unique == "Y"),
+            columns=columns_data
+        )
+
+
+def _fetch_schema_listing() -> tuple:
+    """
+    Fetch the unfiltered table, view and procedure listings in one round-trip.
+
+    Returns:
+        Tuple of (tables, views, procedures) rows
+    """
+    cm, conn, cursor = get_connection_and_cursor()
+    failed = False
+
+    try:
+        tables_query = """
+            SELECT t.table_name, USER_NAME(t.creator) AS owner_name, t.table_type_str, t.count
+            FROM SYS.SYSTAB t
+            WHERE t.table_type = 1
+              AND t.creator IN ({users_filter})
+            ORDER BY t.table_name
+        """
+
+        views_query = """
+            SELECT t.table_name AS view_name, USER_NAME(t.creator) AS owner_name
+            FROM SYS.SYSTAB t
+            WHERE t.table_type = 21
+              AND t.creator IN ({users_filter})
+            ORDER BY t.table_name
+        """
+
+        procedures_query = """
+            SELECT p.proc_name, USER_NAME(p.creator) AS owner_name
+            FROM SYS.SYSPROCEDURE p
+            WHERE p.creator IN ({users_filter})
+            ORDER BY p.proc_name
+        """
+
+        tables, views, procedures = _execute_batch(
+            cursor,
+            "schema listing",
+            [
+                _apply_security_filter_to_query(query, cm)
+                for query in (tables_query, views_query, procedures_query)
+            ]
+        )
+        return tables, views, procedures
+
+    except pyodbc.Error:
+        # Probe the connection before it is used again
+        failed = True
+        raise
 
     finally:
-        cursor.close()
+        cm.release_cursor(cursor, failed=failed)
 
 
-async def get_database_info() -> str:
+async def list_all_schema(
+    limit: int = 100,
+    response_format: ResponseFormat = ResponseFormat.MARKDOWN
+) -> str:
     """
-    Get database metadata and connection information.
+    List tables, views and procedures together in a single round-trip.
+
+    The full listing is kept in the metadata cache, so unfiltered
+    list_tables, list_views and list_procedures calls that follow are served
+    without querying the database again.
+
+    Args:
+        limit: Maximum number of objects to return per object type
+        response_format: Output format (markdown or json)
+
+    Returns:
+        Formatted tables, views and procedures in requested format
+    """
+    all_tables, all_views, all_procedures = await run_in_db_thread(
+        _get_cached_metadata, "listing", "*", lambda _: _fetch_schema_listing()
+    )
+
+    tables = all_tables[:limit]
+    views = all_views[:limit]
+    procedures = all_procedures[:limit]
+
+    has_more = len(all_tables) > limit
+    next_offset = limit if has_more else None
+
+    if response_format == ResponseFormat.JSON:
+        response = SchemaListResponse(
+            tables=TableListResponse(
+                tables=_table_list_models(tables),
+                total_count=len(all_tables),
+                count=len(tables),
+                offset=0,
+                has_more=has_more,
+                next_offset=next_offset
+            ),
+            views=ViewListResponse(
+                views=_view_list_models(views),
+                total_count=len(all_views),
+                has_more=len(all_views) > limit
+            ),
+            procedures=ProcedureListResponse(
+                procedures=_procedure_list_models(procedures),
+                total_count=len(all_procedures),
+                has_more=len(all_procedures) > limit
+            )
+        )
+        return formatters.to_json(response)
+    else:
+        return "\n\n".join([
+            formatters.format_table_list_markdown_with_pagination(
+                tables, len(all_tables), len(tables), 0, has_more, next_offset
+            ),
+            formatters.format_view_list_markdown(views, len(all_views)),
+            formatters.format_procedure_list_markdown(procedures, len(all_procedures)),
+        ])
+
+
+def _fetch_database_info() -> str:
+    """
+    Fetch database properties and object counts and render them.
+
+    The PROPERTY query and the count query are sent as one batch, so an
+    uncached call costs a single database round-trip.
 
     Returns:
         Markdown formatted database information
     """
     cm, conn, cursor = get_connection_and_cursor()
+    failed = False
 
     try:
-        output = []
-        output.append("## Database Information")
-        output.append("")
-
-        # Get database property
-        cursor.execute("SELECT PROPERTY('Name'), PROPERTY('ProductVersion')")
-        db_info = cursor.fetchone()
-        output.append(f"**Database Name**: {db_info[0]}")
-        output.append(f"**SQL Anywhere Version**: {db_info[1]}")
-        output.append("")
-
-        # Get connection info
-        output.append("### Connection Information")
-        output.append("")
-        output.append(f"**Server Name**: {conn.getinfo(pyodbc.SQL_SERVER_NAME)}")
-        output.append(f"**Database Name**: {conn.getinfo(pyodbc.SQL_DATABASE_NAME)}")
-        output.append(f"**DBMS Name**: {conn.getinfo(pyodbc.SQL_DBMS_NAME)}")
-        output.append(f"**DBMS Version**: {conn.getinfo(pyodbc.SQL_DBMS_VER)}")
-        output.append("")
-
-        # Get database properties
-        cursor.execute("""
+        # Database properties (unfiltered, so no {users_filter} parameters)
+        props_query = """
             SELECT
+                PROPERTY('Name'),
+                PROPERTY('ProductVersion'),
                 PROPERTY('Charset'),
                 PROPERTY('Collation'),
                 PROPERTY('PageSize')
-        """)
-
-        props = cursor.fetchone()
-        output.append("### Database Properties")
-        output.append("")
-        output.append(f"**Character Set**: {props[0]}")
-        output.append(f"**Collation**: {props[1]}")
-        output.append(f"**Page Size**: {props[2]} bytes")
-        output.append("")
-
-        # Count tables (filtered by authorized users)
-        authorized_users = cm._authorized_users
-
-        base_query = """
-            SELECT COUNT(*)
-            FROM SYS.SYSTAB t
-            JOIN SYS.SYSUSER u ON t.creator = u.user_id
-            WHERE t.table_type_str = 'BASE'
-              AND u.user_name IN ({users_filter})
         """
-        query, params = _apply_security_filter_to_query(base_query, authorized_users)
-        cursor.execute(query, params)
-        table_count = cursor.fetchone()[0]
 
-        # Count views (filtered by authorized users)
-        base_query = """
-            SELECT COUNT(*)
+        # Count tables, views and procedures (filtered by authorized users)
+        # in one statement using conditional aggregation. The creator filter
+        # uses pre-resolved user_ids, so no SYSUSER join runs first; SYS.SYSTAB
+        # and SYS.SYSPROCEDURE are catalog views, so no index hints are given.
+        count_query = """
+            SELECT
+                SUM(CASE WHEN t.table_type = 1 THEN 1 ELSE 0 END),
+                SUM(CASE WHEN t.table_type = 21 THEN 1 ELSE 0 END),
+                (SELECT COUNT(*)
+                 FROM SYS.SYSPROCEDURE p
+                 WHERE p.creator IN ({users_filter}))
             FROM SYS.SYSTAB t
-            JOIN SYS.SYSUSER u ON t.creator = u.user_id
-            WHERE t.table_type_str = 'VIEW'
-              AND u.user_name IN ({users_filter})
+            WHERE t.creator IN ({users_filter})
         """
-        query, params = _apply_security_filter_to_query(base_query, authorized_users)
-        cursor.execute(query, params)
-        view_count = cursor.fetchone()[0]
-
-        # Count procedures (filtered by authorized users)
-        base_query = """
-            SELECT COUNT(*)
-            FROM SYS.SYSPROCEDURE p
-            JOIN SYS.SYSUSER u ON p.creator = u.user_id
-            WHERE u.user_name IN ({users_filter})
-        """
-        query, params = _apply_security_filter_to_query(base_query, authorized_users)
-        cursor.execute(query, params)
-        proc_count = cursor.fetchone()[0]
 
-        output.append("### Database Objects")
-        output.append("")
-        output.append(f"- **Tables** (authorized): {table_count:,}")
-        output.append(f"- **Views** (authorized): {view_count:,}")
-        output.append(f"- **Procedures/Functions**: {proc_count:,}")
+        # Both statements go to the server in one round-trip. With no
+        # authorized user every count is zero, so the count query is skipped.
+        statements = [(props_query, ())]
+        if cm.authorized_user_filter[0]:
+            statements.append(_apply_security_filter_to_query(count_query, cm))
+        props_rows, *count_rows = _execute_batch(cursor, "database info", statements)
+        db_name, db_version, charset, collation, page_size = props_rows[0]
+
+        # SUM over no rows is NULL; normalize all three counts to plain ints
+        counts = count_rows[0][0] if count_rows else (0, 0, 0)
+        table_count, view_count, proc_count = (int(count or 0) for count in counts)
+
+        # Driver info is read once per connection by the connection manager
+        info = cm.connection_info
+
+        output = [
+            "## Database Information",
+            "",
+            f"**Database Name**: {db_name}",
+            f"**SQL Anywhere Version**: {db_version}",
+            "",
+            "### Connection Information",
+            "",
+            f"**Server Name**: {info['server_name']}",
+            f"**Database Name**: {info['database_name']}",
+            f"**DBMS Name**: {info['dbms_name']}",
+            f"**DBMS Version**: {info['dbms_version']}",
+            "",
+            "### Database Properties",
+            "",
+            f"**Character Set**: {charset}",
+            f"**Collation**: {collation}",
+            f"**Page Size**: {page_size} bytes",
+            "",
+            "### Database Objects",
+            "",
+            f"- **Tables** (authorized): {table_count:,}",
+            f"- **Views** (authorized): {view_count:,}",
+            f"- **Procedures/Functions**: {proc_count:,}",
+        ]
 
         return "\n".join(output)
 
+    except pyodbc.Error:
+        # Probe the connection before it is used again
+        failed = True
+        raise
+
     finally:
-        cursor.close()
+        cm.release_cursor(cursor, failed=failed)
+
+
+async def get_database_info() -> str:
+    """
+    Get database metadata and connection information.
+
+    Repeated calls within a short window are served from the metadata cache.
+
+    Returns:
+        Markdown formatted database information
+    """
+    return await run_in_db_thread(
+        _get_cached_metadata, "database_info", "*", lambda _: _fetch_database_info(),
+        ttl=_DATABASE_INFO_CACHE_TTL
+    )
@@ -4,11 +4,17 @@ This server provides tools to interact with SAP SQL Anywhere databases via ODBC,
 including schema discovery, metadata queries, and safe data retrieval.
 
 Uses FastMCP framework for automatic tool registration and input validation.
+
+Tools are thin async wrappers. Blocking ODBC work never runs on the event
+loop: the schema and queries entry points hand it to a database worker thread
+once, with db.run_in_db_thread, so concurrent tool calls are not serialized
+behind a single database round-trip.
 """
 
+from typing import Awaitable, Optional
 from mcp.server.fastmcp import FastMCP
+from mcp.types import Tool, ToolAnnotations
 from sqlanywhere_mcp.models import (
-    ResponseFormat,
     ListTablesInput,
     ListViewsInput,
     GetTableDetailsInput,
@@ -17,30 +23,118 @@ from sqlanywhere_mcp.models import (
     GetProcedureDetailsInput,
     ListIndexesInput,
     GetIndexDetailsInput,
+    ListAllSchemaInput,
     ExecuteQueryInput,
     ValidateQueryInput,
 )
 from sqlanywhere_mcp import schema, queries
-from sqlanywhere_mcp.db import get_connection_manager
+from sqlanywhere_mcp.db import ConnectionManager, get_connection_manager, run_in_db_thread
 from sqlanywhere_mcp.errors import MCPError
 
+
+class _SQLAnywhereMCP(FastMCP):
+    """FastMCP server that builds its tool definitions once."""
+
+    _tool_list: Optional[list[Tool]] = None
+
+    def add_tool(self, *args, **kwargs) -> None:
+        """Register a tool and drop the cached tool definitions."""
+        super().add_tool(*args, **kwargs)
+        self._tool_list = None
+
+    def remove_tool(self, *args, **kwargs) -> None:
+        """Remove a tool and drop the cached tool definitions."""
+        super().remove_tool(*args, **kwargs)
+        self._tool_list = None
+
+    async def list_tools(self) -> list[Tool]:
+        """
+        List all available tools.
+
+        Tools are all registered at import, so the definitions (with their long
+        descriptions and input schemas) are built on the first tools/list
+        request and reused after that. Adding, replacing or removing a tool
+        rebuilds them.
+
+        Returns:
+            Tool definitions for MCP discovery
+        """
+        if self._tool_list is None:
+            self._tool_list = await super().list_tools()
+        return self._tool_list
+
+
 # Initialize FastMCP server
-mcp = FastMCP("sqlanywhere_mcp")
+mcp = _SQLAnywhereMCP("sqlanywhere_mcp")
+
+
+def _read_only_annotations(title: str, open_world: bool = True) -> ToolAnnotations:
+    """
+    Build the annotations shared by every tool in this server.
+
+    All tools are read-only, non-destructive and idempotent, so only the title
+    and the open-world hint vary. Returning a ToolAnnotations instance means
+    FastMCP stores it as-is at registration instead of validating a dict.
+
+    Args:
+        title: Human-readable tool title
+        open_world: Whether the tool talks to the database
+
+    Returns:
+        Annotations for @mcp.tool
+    """
+    return ToolAnnotations(
+        title=title,
+        readOnlyHint=True,
+        destructiveHint=False,
+        idempotentHint=True,
+        openWorldHint=open_world,
+    )
+
+
+async def _run_tool(call: Awaitable[str]) -> str:
+    """
+    Await a tool implementation, returning known errors as tool output.
+
+    Args:
+        call: Coroutine from a schema or queries entry point
+
+    Returns:
+        Tool output, or the formatted error message
+    """
+    try:
+        return await call
+    except ValueError as e:
+        return f"## Error\n\n{str(e)}"
+    except MCPError as e:
+        return str(e)
 
 
 # ============================================================================
 # Connection Management
 # ============================================================================
 
+def _verified_connection_info(cm: ConnectionManager) -> dict:
+    """
+    Probe the database connection, reconnecting if it is gone.
+
+    Server and database names are cached per connection, so once the
+    SELECT 1 probe succeeds they are returned without further round-trips.
+
+    Args:
+        cm: Connection manager to check
+
+    Returns:
+        Driver information for the live connection
+    """
+    if not cm.is_connected():
+        cm.reconnect()
+    return cm.connection_info
+
+
 @mcp.tool(
     name="sqlanywhere_connect",
-    annotations={
-        "title": "Connect to SQL Anywhere Database",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True
-    }
+    annotations=_read_only_annotations("Connect to SQL Anywhere Database"),
 )
 async def sqlanywhere_connect():
     """Establish connection to SQL Anywhere database.
@@ -60,14 +154,13 @@ async def sqlanywhere_connect():
         - Suggests checking ODBC driver installation and connection parameters
     """
     try:
-        import pyodbc
         cm = get_connection_manager()
-        conn = cm.connect()
+        info = await run_in_db_thread(_verified_connection_info, cm)
 
         return (
             f"✅ Connected to SQL Anywhere database\n\n"
-            f"**Server**: {conn.getinfo(pyodbc.SQL_SERVER_NAME)}\n"
-            f"**Database**: {conn.getinfo(pyodbc.SQL_DATABASE_NAME)}\n"
+            f"**Server**: {info['server_name']}\n"
+            f"**Database**: {info['database_name']}\n"
         )
     except Exception as e:
         return f"## Connection Error\n\n{str(e)}"
@@ -79,13 +172,7 @@ async def sqlanywhere_connect():
 
 @mcp.tool(
     name="sqlanywhere_list_tables",
-    annotations={
-        "title": "List SQL Anywhere Tables",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True
-    }
+    annotations=_read_only_annotations("List SQL Anywhere Tables"),
 )
 async def sqlanywhere_list_tables(params: ListTablesInput):
     """List all tables in the SQL Anywhere database.
@@ -157,29 +244,18 @@ async def sqlanywhere_list_tables(params: ListTablesInput):
         - Only returns tables owned by authorized users (SQLANYWHERE_AUTHORIZED_USERS)
         - All table access is filtered by owner authorization
     """
-    try:
-        return await schema.list_tables(
-            owner=params.owner,
-            search=params.search,
-            limit=params.limit,
-            offset=params.offset,
-            response_format=params.response_format
-        )
-    except ValueError as e:
-        return f"## Error\n\n{str(e)}"
-    except MCPError as e:
-        return str(e)
+    return await _run_tool(schema.list_tables(
+        owner=params.owner,
+        search=params.search,
+        limit=params.limit,
+        offset=params.offset,
+        response_format=params.response_format
+    ))
 
 
 @mcp.tool(
     name="sqlanywhere_get_table_details",
-    annotations={
-        "title": "Get Table Schema Details",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True
-    }
+    annotations=_read_only_annotations("Get Table Schema Details"),
 )
 async def sqlanywhere_get_table_details(params: GetTableDetailsInput):
     """Get comprehensive metadata for a specific SQL Anywhere table.
@@ -248,13 +324,10 @@ async def sqlanywhere_get_table_details(params: GetTableDetailsInput):
         - Only accessible for tables owned by authorized users
         - All metadata queries include security filtering
     """
-    try:
-        return await schema.get_table_details(
-            table_name=params.table_name,
-            response_format=params.response_format
-        )
-    except MCPError as e:
-        return str(e)
+    return await _run_tool(schema.get_table_details(
+        table_name=params.table_name,
+        response_format=params.response_format
+    ))
 
 
 # ============================================================================
@@ -263,13 +336,7 @@ async def sqlanywhere_get_table_details(params: GetTableDetailsInput):
 
 @mcp.tool(
     name="sqlanywhere_list_views",
-    annotations={
-        "title": "List SQL Anywhere Views",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True
-    }
+    annotations=_read_only_annotations("List SQL Anywhere Views"),
 )
 async def sqlanywhere_list_views(params: ListViewsInput):
     """List all views in the SQL Anywhere database.
@@ -327,28 +394,17 @@ async def sqlanywhere_list_views(params: ListViewsInput):
         - Only returns views owned by authorized users (SQLANYWHERE_AUTHORIZED_USERS)
         - All view access is filtered by owner authorization
     """
-    try:
-        return await schema.list_views(
-            owner=params.owner,
-            search=params.search,
-            limit=params.limit,
-            response_format=params.response_format
-        )
-    except ValueError as e:
-        return f"## Error\n\n{str(e)}"
-    except MCPError as e:
-        return str(e)
+    return await _run_tool(schema.list_views(
+        owner=params.owner,
+        search=params.search,
+        limit=params.limit,
+        response_format=params.response_format
+    ))
 
 
 @mcp.tool(
     name="sqlanywhere_get_view_details",
-    annotations={
-        "title": "Get View Schema Details",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True
-    }
+    annotations=_read_only_annotations("Get View Schema Details"),
 )
 async def sqlanywhere_get_view_details(params: GetViewDetailsInput):
     """Get detailed information about a specific SQL Anywhere view.
@@ -407,13 +463,10 @@ async def sqlanywhere_get_view_details(params: GetViewDetailsInput):
         - Only accessible for views owned by authorized users
         - All metadata queries include security filtering
     """
-    try:
-        return await schema.get_view_details(
-            view_name=params.view_name,
-            response_format=params.response_format
-        )
-    except MCPError as e:
-        return str(e)
+    return await _run_tool(schema.get_view_details(
+        view_name=params.view_name,
+        response_format=params.response_format
+    ))
 
 
 # ============================================================================
@@ -422,13 +475,7 @@ async def sqlanywhere_get_view_details(params: GetViewDetailsInput):
 
 @mcp.tool(
     name="sqlanywhere_list_procedures",
-    annotations={
-        "title": "List Stored Procedures and Functions",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True
-    }
+    annotations=_read_only_annotations("List Stored Procedures and Functions"),
 )
 async def sqlanywhere_list_procedures(params: ListProceduresInput):
     """List all stored procedures and functions in the SQL Anywhere database.
@@ -487,28 +534,17 @@ async def sqlanywhere_list_procedures(params: ListProceduresInput):
         - Only returns procedures owned by authorized users (SQLANYWHERE_AUTHORIZED_USERS)
         - All procedure access is filtered by owner authorization
     """
-    try:
-        return await schema.list_procedures(
-            owner=params.owner,
-            search=params.search,
-            limit=params.limit,
-            response_format=params.response_format
-        )
-    except ValueError as e:
-        return f"## Error\n\n{str(e)}"
-    except MCPError as e:
-        return str(e)
+    return await _run_tool(schema.list_procedures(
+        owner=params.owner,
+        search=params.search,
+        limit=params.limit,
+        response_format=params.response_format
+    ))
 
 
 @mcp.tool(
     name="sqlanywhere_get_procedure_details",
-    annotations={
-        "title": "Get Stored Procedure Details",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True
-    }
+    annotations=_read_only_annotations("Get Stored Procedure Details"),
 )
 async def sqlanywhere_get_procedure_details(params: GetProcedureDetailsInput):
     """Get detailed information about a specific stored procedure or function.
@@ -566,13 +602,10 @@ async def sqlanywhere_get_procedure_details(params: GetProcedureDetailsInput):
         - Only accessible for procedures owned by authorized users
         - All metadata queries include security filtering
     """
-    try:
-        return await schema.get_procedure_details(
-            procedure_name=params.procedure_name,
-            response_format=params.response_format
-        )
-    except MCPError as e:
-        return str(e)
+    return await _run_tool(schema.get_procedure_details(
+        procedure_name=params.procedure_name,
+        response_format=params.response_format
+    ))
 
 
 # ============================================================================
@@ -581,13 +614,7 @@ async def sqlanywhere_get_procedure_details(params: GetProcedureDetailsInput):
 
 @mcp.tool(
     name="sqlanywhere_list_indexes",
-    annotations={
-        "title": "List Database Indexes",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True
-    }
+    annotations=_read_only_annotations("List Database Indexes"),
 )
 async def sqlanywhere_list_indexes(params: ListIndexesInput):
     """List all indexes in the SQL Anywhere database.
@@ -650,26 +677,17 @@ async def sqlanywhere_list_indexes(params: ListIndexesInput):
         - Only returns indexes on tables owned by authorized users
         - All index access is filtered by owner authorization
     """
-    try:
-        return await schema.list_indexes(
-            search=params.search,
-            limit=params.limit,
-            offset=params.offset,
-            response_format=params.response_format
-        )
-    except MCPError as e:
-        return str(e)
+    return await _run_tool(schema.list_indexes(
+        search=params.search,
+        limit=params.limit,
+        offset=params.offset,
+        response_format=params.response_format
+    ))
 
 
 @mcp.tool(
     name="sqlanywhere_get_index_details",
-    annotations={
-        "title": "Get Index Details",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True
-    }
+    annotations=_read_only_annotations("Get Index Details"),
 )
 async def sqlanywhere_get_index_details(params: GetIndexDetailsInput):
     """Get detailed information about a specific index.
@@ -726,13 +744,73 @@ async def sqlanywhere_get_index_details(params: GetIndexDetailsInput):
         - Only accessible for indexes on tables owned by authorized users
         - All metadata queries include security filtering
     """
-    try:
-        return await schema.get_index_details(
-            index_name=params.index_name,
-            response_format=params.response_format
-        )
-    except MCPError as e:
-        return str(e)
+    return await _run_tool(schema.get_index_details(
+        index_name=params.index_name,
+        response_format=params.response_format
+    ))
+
+
+# ============================================================================
+# Schema Discovery - Overview
+# ============================================================================
+
+@mcp.tool(
+    name="sqlanywhere_list_all_schema",
+    annotations=_read_only_annotations("List Tables, Views and Procedures"),
+)
+async def sqlanywhere_list_all_schema(params: ListAllSchemaInput):
+    """List tables, views, and stored procedures in a single call.
+
+    This tool fetches all three listings in one database round-trip and keeps
+    them cached, so unfiltered sqlanywhere_list_tables, sqlanywhere_list_views
+    and sqlanywhere_list_procedures calls that follow are answered from the
+    cache. Only exposes objects created by authorized users (configured via
+    SQLANYWHERE_AUTHORIZED_USERS).
+
+    Args:
+        params (ListAllSchemaInput): Input parameters containing:
+            - limit (int): Maximum number of objects to return per object type (default: 100, range: 1-10000)
+            - response_format (ResponseFormat): Output format - 'markdown' or 'json' (default: 'markdown')
+
+    Returns:
+        str: Formatted schema overview with the following schema:
+
+        Markdown format:
+        ## Tables (N found)
+        | Table Name | Owner | Type | Row Count |
+        ...
+
+        ## Views (N found)
+        | View Name | Owner |
+        ...
+
+        ## Procedures & Functions (N found)
+        | Name | Owner |
+        ...
+
+        JSON format:
+        {
+            "tables": { same as sqlanywhere_list_tables },
+            "views": { same as sqlanywhere_list_views },
+            "procedures": { same as sqlanywhere_list_procedures }
+        }
+
+    Examples:
+        - Use when: "Give me an overview of what is in this database"
+        - Use when: You are about to list tables, views and procedures one after another
+        - Don't use when: You need to filter by owner or search by name (use the individual list tools)
+
+    Error Handling:
+        - Pydantic validates input parameters (limit range)
+        - Returns empty sections if no objects are found
+
+    Security:
+        - Only returns objects owned by authorized users (SQLANYWHERE_AUTHORIZED_USERS)
+    """
+    return await _run_tool(schema.list_all_schema(
+        limit=params.limit,
+        response_format=params.response_format
+    ))
 
 
 # ============================================================================
@@ -741,13 +819,7 @@ async def sqlanywhere_get_index_details(params: GetIndexDetailsInput):
 
 @mcp.tool(
     name="sqlanywhere_get_database_info",
-    annotations={
-        "title": "Get Database Information",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True
-    }
+    annotations=_read_only_annotations("Get Database Information"),
 )
 async def sqlanywhere_get_database_info():
     """Get database metadata and connection information.
@@ -794,10 +866,7 @@ async def sqlanywhere_get_database_info():
         - Object counts are filtered by authorized users
         - Only shows counts for objects owned by authorized users
     """
-    try:
-        return await schema.get_database_info()
-    except MCPError as e:
-        return str(e)
+    return await _run_tool(schema.get_database_info())
 
 
 # ============================================================================
@@ -806,13 +875,7 @@ async def sqlanywhere_get_database_info():
 
 @mcp.tool(
     name="sqlanywhere_execute_query",
-    annotations={
-        "title": "Execute SQL SELECT Query",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": True
-    }
+    annotations=_read_only_annotations("Execute SQL SELECT Query"),
 )
 async def sqlanywhere_execute_query(params: ExecuteQueryInput):
     """Execute a SELECT query on the SQL Anywhere database.
@@ -833,7 +896,8 @@ async def sqlanywhere_execute_query(params: ExecuteQueryInput):
                 - "SELECT c.Id, c.Name, o.OrderId FROM dbo.Customers c JOIN dbo.Orders o ON c.Id = o.CustomerId"
             - limit (Optional[int]): Maximum rows to return (default: 1000, max: 10000).
               If not specified, uses configured default (SQLANYWHERE_MAX_ROWS env var).
-            - response_format (ResponseFormat): Output format - 'markdown' or 'json' (default: 'markdown')
+            - response_format (QueryResponseFormat): Output format - 'markdown', 'json' or
+              'json_compact' (default: 'markdown')
 
     Returns:
         str: Formatted query results with the following schema:
@@ -862,6 +926,19 @@ async def sqlanywhere_execute_query(params: ExecuteQueryInput):
             "has_more": bool
         }
 
+        JSON compact format (single line; column names sent once, rows as value arrays):
+        {
+            "columns": [str, ...],
+            "column_types": {"column1": "type1", ...},
+            "rows": [
+                [value1, value2, ...],
+                ...
+            ],
+            "row_count": int,
+            "execution_time_seconds": float,
+            "has_more": bool
+        }
+
     Examples:
         - Use when: "Get all parts with Type = 1"
         - Use when: "List customer names and IDs"
@@ -879,26 +956,17 @@ async def sqlanywhere_execute_query(params: ExecuteQueryInput):
         - Enforces maximum row limits to prevent large result sets
         - All queries use parameterized bindings to prevent SQL injection
     """
-    try:
-        return await queries.execute_query(
-            query=params.query,
-            limit=params.limit,
-            response_format=params.response_format
-        )
-    except MCPError as e:
-        return str(e)
+    return await _run_tool(queries.execute_query(
+        query=params.query,
+        limit=params.limit,
+        response_format=params.response_format
+    ))
 
 
 
 @mcp.tool(
     name="sqlanywhere_validate_query",
-    annotations={
-        "title": "Validate SQL Query",
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "idempotentHint": True,
-        "openWorldHint": False
-    }
+    annotations=_read_only_annotations("Validate SQL Query", open_world=False),
 )
 async def sqlanywhere_validate_query(params: ValidateQueryInput):
     """Validate a SQL query without executing it.
@@ -927,14 +995,12 @@ async def sqlanywhere_validate_query(params: ValidateQueryInput):
         - Returns additional validation errors for dangerous keywords
 
     Security:
-        - Checks for dangerous SQL keywords (DROP, DELETE, INSERT, UPDATE, CREATE, ALTER, TRUNCATE)
+        - Checks for dangerous SQL keywords (DROP, DELETE, INSERT, UPDATE, CREATE, ALTER, TRUNCATE,
+          GRANT, REVOKE, EXEC, EXECUTE)
         - Validates basic SQL syntax
         - Does not execute the query (read-only validation)
     """
-    try:
-        return await queries.validate_query(query=params.query)
-    except MCPError as e:
-        return str(e)
+    return await _run_tool(queries.validate_query(query=params.query))
 
 
 # ============================================================================
@@ -0,0 +1,49 @@
+"""Tests for query authorization in sqlanywhere_mcp.queries."""
+
+import pytest
+
+from sqlanywhere_mcp.db import ConnectionManager
+from sqlanywhere_mcp.errors import QueryValidationError
+from sqlanywhere_mcp.queries import _table_references, _validate_query_authorization
+
+
+@pytest.fixture
+def cm(monkeypatch):
+    """Connection manager authorized for the monitor owner only."""
+    monkeypatch.setenv("SQLANYWHERE_CONNECTION_STRING", "DSN=test")
+    monkeypatch.setenv("SQLANYWHERE_AUTHORIZED_USERS", "monitor")
+    return ConnectionManager()
+
+
+@pytest.mark.parametrize("query", [
+    "SELECT CASE WHEN 1=1 THEN (/**/SELECT TOP 1 pwd FROM dbo.Secret) END FROM monitor.T",
+    "SELECT a FROM monitor.T EXCEPT (/* x */ SELECT a FROM dbo.Secret)",
+    "SELECT DISTINCT (/**/SELECT pwd FROM dbo.Secret) FROM monitor.T",
+    "SELECT a FROM monitor.T GROUP BY a HAVING (-- c\nSELECT 1 FROM dbo.Secret) > 0",
+    "SELECT a FROM monitor.T WHERE a > (// c\nSELECT 1 FROM dbo.Secret)",
+    "SELECT '--', (SELECT pwd FROM dbo.Secret) FROM monitor.T",
+    "SELECT EXTRACT(YEAR FROM (SELECT d FROM dbo.Secret)) FROM monitor.T",
+])
+def test_subquery_owner_is_checked(cm, query):
+    """Subqueries behind comments or keywords still have their owner checked."""
+    with pytest.raises(QueryValidationError, match="dbo"):
+        _validate_query_authorization(query, cm)
+
+
+@pytest.mark.parametrize("query", [
+    "SELECT EXTRACT(YEAR FROM d) FROM monitor.T",
+    "SELECT SUBSTRING(x.s FROM 2 FOR 3) FROM monitor.T x",
+    "SELECT TRIM(BOTH ' ' FROM name) FROM monitor.T",
+    "SELECT POSITION('a' IN name) FROM monitor.T",
+    "SELECT a FROM \"monitor\".\"T\" -- FROM dbo.Secret",
+])
+def test_authorized_query_passes(cm, query):
+    """FROM inside known function arguments and comments is not a table reference."""
+    _validate_query_authorization(query, cm)
+
+
+def test_unknown_function_from_is_checked():
+    """A FROM inside any other function's parentheses is treated as a table."""
+    assert _table_references("SELECT f(a FROM dbo.x) FROM monitor.T") == [
+        ("dbo", "x"), ("monitor", "T"),
+    ]